@@ -1,3 +1,4 @@
+from functools import cached_property, lru_cache
 from typing import Optional
 from urllib.parse import quote_plus
 
@@ -21,10 +22,38 @@ class DatabaseConfig(BaseSettings):
         default=True,
         description="If true, disable connection pooling so serverless DBs can pause.",
     )
+    pool_size: int = Field(
+        default=20,
+        ge=1,
+        description="Persistent connections kept in the pool when pooling is enabled.",
+    )
+    max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Extra connections allowed above pool_size during bursts.",
+    )
+    pool_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for a pooled connection before failing.",
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        description="Recycle pooled connections after this many seconds (-1 disables).",
+    )
+    disable_jit: bool = Field(
+        default=True,
+        description="Turn off PostgreSQL JIT for the short OLTP queries this API issues.",
+    )
+    query_cache_size: int = Field(
+        default=1200,
+        ge=0,
+        description="Compiled SQL statements SQLAlchemy keeps per engine (0 disables).",
+    )
 
-    @property
+    @cached_property
     def url(self) -> str:
-        """Get database URL"""
+        """Get database URL (built once; the config is frozen)"""
         username = quote_plus(self.username)
         password = quote_plus(self.password.get_secret_value())
         return (
@@ -39,6 +68,7 @@ class DatabaseConfig(BaseSettings):
         secrets_dir=".secrets",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
 
@@ -72,6 +102,28 @@ class PollyConfig(BaseSettings):
     )
 
 
+class TranscribeConfig(BaseSettings):
+    """Amazon Transcribe streaming configuration."""
+
+    max_concurrent_streams: int = Field(
+        default=8,
+        ge=1,
+        description="Transcription streams (and ffmpeg conversions) allowed in flight at once.",
+    )
+    stream_timeout_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Upper bound for one ffmpeg conversion plus its transcription stream.",
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="TRANSCRIBE_",
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
+
 class BedrockConfig(BaseSettings):
     """Amazon Bedrock configuration."""
 
@@ -181,11 +233,20 @@ class Settings(BaseSettings):
     app_name: str = "EcoWhiskey ATC Backend"
     app_version: str = "1.0.0"
     debug: bool = False
+    sql_echo: bool = Field(
+        default=False,
+        description="Log every SQL statement; kept separate from debug because it is costly.",
+    )
     host: str = "0.0.0.0"
     port: int = 8000
     log_file: str = "logs/app.log"
     audio_log_file: str = "logs/audio_pipeline.log"
     transcript_log_file: str = "logs/transcripts.log"
+    max_audio_upload_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=1,
+        description="Largest student recording accepted by /audio/analyze.",
+    )
 
     # Database
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
@@ -196,6 +257,9 @@ class Settings(BaseSettings):
     # Polly
     polly: PollyConfig = Field(default_factory=PollyConfig)
 
+    # Transcribe
+    transcribe: TranscribeConfig = Field(default_factory=TranscribeConfig)
+
     # Bedrock
     bedrock: BedrockConfig = Field(default_factory=BedrockConfig)
 
@@ -224,5 +288,12 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment only once."""
+
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
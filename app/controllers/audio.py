@@ -10,11 +10,15 @@ or the documentation in `docs/audio_pipeline_overview.md`. The POST
 4. Phase transition bookkeeping, turn persistence, logging, and readback TTS upload.
 """
 
+import asyncio
 import logging
-from typing import Any, Mapping
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Annotated, Any, Coroutine, Mapping
 from uuid import UUID
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse
 
 from app.config.settings import settings
 from app.controllers.dependencies import CurrentUserDep, SessionDep
@@ -22,10 +26,13 @@ from app.models.phase_score import PhaseScore
 from app.pipelines.audio import (
     AudioAnalysisPipeline,
     LlmOutcome,
+    SessionContext,
+    SessionView,
     build_llm_request,
     classify_intent,
     call_conversation_llm,
     context_base,
+    context_base_header,
     fetch_session_context,
     normalize_frequency,
     read_audio_bytes,
@@ -34,7 +41,7 @@ from app.pipelines.audio import (
     transcribe_audio,
 )
 from app.pipelines.audio.cleaning import clean_transcription
-from app.services.context_repository import MAX_TURNS_STORED, append_turn
+from app.services.context_repository import MAX_TURNS_STORED, append_turns
 from app.services.storage import upload_session_asset
 
 router = APIRouter(prefix="/audio", tags=["audio"])
@@ -44,34 +51,74 @@ transcript_logger = logging.getLogger("app.logs.transcript")
 
 
 RECENT_TURNS_LIMIT = 8  # Keep a short tail of turns for LLM context and storage replay.
+# Shorter transcripts are noise; skip the LLM, TTS and persistence.
+MIN_TRANSCRIPT_CHARS = 2
+NO_SPEECH_FEEDBACK = "No se detectó voz en la transmisión. Intenta de nuevo."
 PIPELINE_STAGES = tuple(AudioAnalysisPipeline.describe())
 """Ordered pipeline metadata used for quick reference and debugging."""
 
 _SESSION_ID_FORM = Form(...)
-_FREQUENCY_FORM = Form(...)
+_FREQUENCY_FORM = Form(..., max_length=16)
+_DIFFICULTY_FORM = Form(5)
 _AUDIO_FILE_UPLOAD = File(...)
 
 
-def _phase_marks_session_completion(phase: Mapping[str, Any] | None) -> bool:
-    """Return True when a scenario phase declares that the session is completed."""
+async def _validated_audio(
+    audio_file: UploadFile = _AUDIO_FILE_UPLOAD,
+) -> tuple[UploadFile, str]:
+    """Resolve the upload's content type, rejecting unsupported files early."""
 
-    return bool(isinstance(phase, Mapping) and phase.get("session_completed"))
+    return audio_file, resolve_content_type(audio_file)
 
 
-@router.post("/analyze")
-async def analyze_audio(
-    _current_user: CurrentUserDep,
-    db_session: SessionDep,
-    session_id: UUID = _SESSION_ID_FORM,
-    frequency: str = _FREQUENCY_FORM,
-    difficulty: int = Form(5),
-    audio_file: UploadFile = _AUDIO_FILE_UPLOAD,
-) -> dict[str, Any]:
-    """Transcribe an uploaded MP3 or M4A file and generate a Polly readback."""
-    content_type = resolve_content_type(audio_file)
-    audio_bytes = await read_audio_bytes(audio_file)
+ValidatedAudioDep = Annotated[tuple[UploadFile, str], Depends(_validated_audio)]
+
+
+@dataclass(slots=True)
+class _TurnLog:
+    """Per-request turn history, cached context header and turns awaiting storage."""
+
+    session_id: UUID
+    user_id: int
+    session_context: SessionContext
+    history: deque[dict[str, Any]]
+    recent: deque[dict[str, Any]]
+    base_header: dict[str, Any] | None = None
+    pending: list[dict[str, Any]] = field(default_factory=list)
+    pending_base_turns: list[dict[str, Any]] = field(default_factory=list)
+
+    def record(self, turn: Mapping[str, Any]) -> None:
+        """Append a turn to the local history and queue it for the next flush.
+
+        Recording locally first lets prompts built before the flush see the turn.
+        """
+
+        if not self.pending:
+            self.pending_base_turns = list(self.history)
+        payload = dict(turn)
+        self.pending.append(payload)
+        self.history.append(payload)
+        self.recent.append(payload)
+
+    def flush(self) -> Coroutine[Any, Any, None]:
+        """Return one storage write for every queued turn, reusing the cached header."""
+
+        if self.base_header is None:
+            self.base_header = context_base_header(self.session_context)
+        base_context = context_base(
+            self.session_context, self.pending_base_turns, header=self.base_header
+        )
+        turns, self.pending = self.pending, []
+        return append_turns(
+            self.session_id, turns, user_id=self.user_id, base_context=base_context
+        )
+
+
+async def _persist_student_audio(
+    session_id: UUID, audio_bytes: bytes, content_type: str
+) -> None:
+    """Archive the student's input audio in S3; failures are only logged."""
 
-    # Persist the student's input audio to S3 (so it is not "deleted" / lost)
     ext = "mp3" if "mpeg" in content_type or "mp3" in content_type else "m4a"
     try:
         await upload_session_asset(
@@ -84,39 +131,141 @@ async def analyze_audio(
     except Exception:
         logger.warning("No se pudo persistir el audio del estudiante en S3", exc_info=True)
 
-    transcript_text = await transcribe_audio(session_id, audio_bytes, content_type)
+
+async def _persist_llm_raw(session_id: UUID, raw_response: str) -> str | None:
+    """Archive the raw LLM output in S3 and return its URL, or None on failure."""
+
+    try:
+        return await upload_session_asset(
+            session_id,
+            raw_response.encode("utf-8"),
+            kind="llm",
+            extension="txt",
+            content_type="text/plain; charset=utf-8",
+        ) or None
+    except Exception:
+        logger.warning(
+            "No se pudo persistir la respuesta cruda del LLM en S3", exc_info=True
+        )
+        return None
+
+
+def _phase_marks_session_completion(phase: Mapping[str, Any] | None) -> bool:
+    """Return True when a scenario phase declares that the session is completed."""
+
+    return phase is not None and bool(phase.get("session_completed"))
+
+
+@router.post("/analyze", response_class=ORJSONResponse)
+async def analyze_audio(
+    _current_user: CurrentUserDep,
+    validated_audio: ValidatedAudioDep,
+    db_session: SessionDep,
+    session_id: UUID = _SESSION_ID_FORM,
+    frequency: str = _FREQUENCY_FORM,
+    difficulty: int = _DIFFICULTY_FORM,
+) -> ORJSONResponse:
+    """Transcribe an uploaded MP3 or M4A file and generate a Polly readback."""
+    # Formatted once for the logs; orjson encodes the UUID itself.
+    session_str = str(session_id)
+    frequency = frequency.strip()  # Trimmed once; every later use sees the clean value.
+    audio_file, content_type = validated_audio
+    audio_bytes = await read_audio_bytes(audio_file)
+
+    # Archiving the student audio, transcription and the context lookup are independent.
+    _, transcript_text, session_context = await asyncio.gather(
+        _persist_student_audio(session_id, audio_bytes, content_type),
+        transcribe_audio(session_id, audio_bytes, content_type),
+        fetch_session_context(session_id),
+    )
+    # fetch_session_context builds a fresh dict per call, so it can be mutated in place.
+    view = SessionView.from_context(session_context)
 
     # Log both for observability and to capture audio transcripts in the dedicated logger.
-    logger.info("Transcripción recibida session=%s: %s", session_id, transcript_text)
-    transcript_logger.info("student | session=%s | frequency=%s | text=%s", session_id, frequency, transcript_text)
+    logger.info("Transcripción recibida session=%s: %s", session_str, transcript_text)
+    # The transcript log level is fixed at startup; check it and build the prefix once.
+    transcript_prefix = (
+        f"session={session_str} | frequency={frequency}"
+        if transcript_logger.isEnabledFor(logging.INFO)
+        else None
+    )
+    if transcript_prefix is not None:
+        transcript_logger.info(
+            "student | %s | text=%s", transcript_prefix, transcript_text
+        )
+
+    if len(transcript_text) < MIN_TRANSCRIPT_CHARS:
+        # Nothing intelligible was said; answer without touching the session state.
+        logger.info(
+            "Transcripción vacía session=%s; se omite el pipeline", session_str
+        )
+        return ORJSONResponse(
+            {
+                "session_id": session_id,
+                "frequency": frequency,
+                "audio_url": None,
+                "controller_text": None,
+                "feedback": NO_SPEECH_FEEDBACK,
+                "session_completed": view.session_completed,
+            }
+        )
 
     # Optional cleaning step
     if settings.bedrock.cleaning_enabled:
         cleaned_text = await clean_transcription(transcript_text)
         if cleaned_text != transcript_text:
-            logger.info("Transcripción limpia session=%s: %s", session_id, cleaned_text)
+            logger.info(
+                "Transcripción limpia session=%s: %s", session_str, cleaned_text
+            )
             transcript_text = cleaned_text
 
-    raw_context = await fetch_session_context(session_id)
-    session_context = dict(raw_context) if isinstance(raw_context, Mapping) else {}
-    history = [dict(turn) for turn in session_context.get("turn_history", []) if isinstance(turn, Mapping)][-MAX_TURNS_STORED:]
-    session_context.update(turn_history=list(history), recent_turns=list(history[-RECENT_TURNS_LIMIT:]), context_base=context_base(session_context, history))
+    # Figure out which frequency bucket the scenario expects for the active phase.
+    scenario_group = (
+        view.phase_frequency_group
+        or view.active_frequency_group
+        or view.default_frequency_group
+        or "tower"
+    )
+    # A transmission on the wrong frequency for a known bucket is rejected whatever the
+    # classifier says, so skip that LLM call and let the scenario intent decide.
+    received_frequency_normalized = normalize_frequency(frequency)
+    scenario_expected_frequency = view.normalized_frequencies.get(scenario_group)
+    frequency_mismatch_known = bool(
+        view.phase_intent
+        and scenario_group != "unknown"
+        and scenario_expected_frequency
+        and received_frequency_normalized != scenario_expected_frequency
+    )
 
-    async def save_turn(turn: Mapping[str, Any]) -> None:
-        """Append a turn to both storage and local context helpers."""
-        payload = dict(turn)
-        await append_turn(session_id, payload, user_id=_current_user.id, base_context=context_base(session_context, history))
-        history.append(payload)
-        history[:] = history[-MAX_TURNS_STORED:]
-        session_context.update(turn_history=list(history), recent_turns=list(history[-RECENT_TURNS_LIMIT:]), context_base=context_base(session_context, history))
+    # Bounded deques drop the oldest turn on append instead of re-slicing the list.
+    # Stored turns are read-only, so they are shared rather than copied per request.
+    history: deque[dict[str, Any]] = deque(
+        (
+            turn
+            for turn in session_context["turn_history"]
+            if isinstance(turn, Mapping)
+        ),
+        maxlen=MAX_TURNS_STORED,
+    )
+    turn_log = _TurnLog(
+        session_id=session_id,
+        user_id=_current_user.id,
+        session_context=session_context,
+        history=history,
+        recent=deque(history, maxlen=RECENT_TURNS_LIMIT),
+    )
+    # The deques are shared with the context, so later appends need no copies.
+    # The persisted context_base is only needed by append_turns; flush builds it.
+    session_context.update(turn_history=turn_log.history, recent_turns=turn_log.recent)
 
     # Seed the conversation with the student's transmission plus any relevant context snapshots.
     student_turn = {"role": "student", "text": transcript_text, "frequency": frequency}
-    meteo, route = session_context.get("meteo"), session_context.get("route")
-    if meteo: student_turn["meteo"] = meteo
-    if route: student_turn["route"] = route
+    if view.meteo: student_turn["meteo"] = view.meteo
+    if view.route: student_turn["route"] = view.route
 
-    intent_classification = await classify_intent(transcript_text, session_context)
+    intent_classification = None
+    if not frequency_mismatch_known:
+        intent_classification = await classify_intent(transcript_text, session_context)
     classifier_intent = None
     classifier_frequency_group = None
     classifier_confidence = None
@@ -131,25 +280,21 @@ async def analyze_audio(
         if classifier_confidence is not None:
             student_turn["intent_confidence"] = classifier_confidence
 
-    await save_turn(student_turn)
+    # The student turn is stored together with the controller turn in a single write;
+    # error paths below flush it on its own so the transmission is never lost.
+    turn_log.record(student_turn)
 
-    current_phase = session_context.get("phase")
-    if not isinstance(current_phase, Mapping):
-        logger.error("No hay fase activa para session=%s", session_id); raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="No hay fase activa configurada para la sesión.")
+    current_phase = view.phase
+    if current_phase is None:
+        logger.error("No hay fase activa para session=%s", session_str); await turn_log.flush(); raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="No hay fase activa configurada para la sesión.")
     current_phase_marks_completion = _phase_marks_session_completion(current_phase)
 
-    scenario_intent = current_phase.get("intent")
+    scenario_intent = view.phase_intent
     phase_intent = classifier_intent or scenario_intent
     if not phase_intent:
-        logger.error("Fase sin intent definido session=%s phase=%s", session_id, current_phase); raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="La fase activa no tiene un intent configurado.")
+        logger.error("Fase sin intent definido session=%s phase=%s", session_str, current_phase); await turn_log.flush(); raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="La fase activa no tiene un intent configurado.")
 
-    # Figure out which frequency bucket should be active and whether the incoming one aligns.
-    scenario_group = (
-        current_phase.get("frequency")
-        or session_context.get("active_frequency_group")
-        or session_context.get("default_frequency_group")
-        or "tower"
-    )
+    # Let the classifier pick the bucket only when the scenario leaves it open.
     active_group = scenario_group
     if classifier_frequency_group:
         if not scenario_group or scenario_group == "unknown":
@@ -157,55 +302,55 @@ async def analyze_audio(
         elif classifier_frequency_group != scenario_group:
             logger.info(
                 "Intent detector frequency mismatch session=%s detected=%s scenario=%s",
-                session_id,
+                session_str,
                 classifier_frequency_group,
                 scenario_group,
             )
         else:
             active_group = scenario_group
-    frequencies = session_context.get("frequencies")
-    expected_frequency = frequencies.get(active_group) if isinstance(frequencies, Mapping) else None
-    normalized_frequency = frequency.strip()
-    expected_frequency_normalized = normalize_frequency(expected_frequency)
-    received_frequency_normalized = normalize_frequency(normalized_frequency)
+    expected_frequency = view.frequencies.get(active_group)
+    expected_frequency_normalized = view.normalized_frequencies.get(active_group)
     session_context["active_frequency_group"] = active_group
     is_valid_frequency = (
         not expected_frequency_normalized
         or received_frequency_normalized == expected_frequency_normalized
     )
 
-    phase_payload = dict(current_phase)
-    if expected_frequency:
-        phase_payload.setdefault(
-            "expected_frequency",
-            expected_frequency_normalized or expected_frequency,
-        )
-    if normalized_frequency:
-        phase_payload.setdefault(
-            "received_frequency",
-            received_frequency_normalized or normalized_frequency,
-        )
+    # Detection details are shared by the LLM phase payload and the response metadata.
+    detection_metadata: dict[str, Any] = {}
     if scenario_intent and scenario_intent != phase_intent:
-        phase_payload.setdefault("scenario_intent", scenario_intent)
+        detection_metadata["scenario_intent"] = scenario_intent
     if classifier_intent:
-        phase_payload.setdefault("detected_intent", classifier_intent)
+        detection_metadata["detected_intent"] = classifier_intent
     if classifier_frequency_group:
-        phase_payload.setdefault("detected_frequency_group", classifier_frequency_group)
+        detection_metadata["detected_frequency_group"] = classifier_frequency_group
     if classifier_confidence is not None:
-        phase_payload.setdefault("intent_confidence", classifier_confidence)
+        detection_metadata["intent_confidence"] = classifier_confidence
 
-    logger.info("Fase activa session=%s phase_id=%s intent=%s freq=%s", session_id, session_context.get("phase_id"), phase_intent, active_group)
+    phase_extras: dict[str, Any] = {}
+    if expected_frequency:
+        phase_extras["expected_frequency"] = (
+            expected_frequency_normalized or expected_frequency
+        )
+    if frequency:
+        phase_extras["received_frequency"] = received_frequency_normalized or frequency
+    phase_extras.update(detection_metadata)
+    # Scenario-defined keys win (setdefault semantics) and keep their prompt order.
+    phase_payload = {
+        **current_phase,
+        **{k: v for k, v in phase_extras.items() if k not in current_phase},
+    }
+
+    logger.info(
+        "Fase activa session=%s phase_id=%s intent=%s freq=%s",
+        session_str,
+        view.phase_id,
+        phase_intent,
+        active_group,
+    )
 
     allow_response = False; controller_text = ""; feedback_text = "Colación recibida."
-    response_intent = phase_intent; response_confidence = None; response_score = None; response_metadata: dict[str, Any] = {}; llm_outcome: LlmOutcome | None = None
-    if classifier_intent:
-        response_metadata["detected_intent"] = classifier_intent
-    if classifier_frequency_group:
-        response_metadata["detected_frequency_group"] = classifier_frequency_group
-    if classifier_confidence is not None:
-        response_metadata["intent_confidence"] = classifier_confidence
-    if scenario_intent and scenario_intent != phase_intent:
-        response_metadata["scenario_intent"] = scenario_intent
+    response_intent = phase_intent; response_confidence = None; response_score = None; response_metadata: dict[str, Any] = dict(detection_metadata); llm_outcome: LlmOutcome | None = None
 
     if is_valid_frequency:
         # Happy path: enrich the transcript with context and delegate phrasing to the LLM.
@@ -231,6 +376,7 @@ async def analyze_audio(
                 response_metadata.update(dict(structured.metadata))
         except Exception as exc:  # pragma: no cover - integration failure
             logger.exception("Fallo en pipeline LLM", exc_info=exc)
+            await turn_log.flush()
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail="No se pudo generar la respuesta del controlador",
@@ -238,7 +384,7 @@ async def analyze_audio(
     else:
         # Frequency mismatch: short-circuit the LLM and send direct feedback.
         display_expected = expected_frequency_normalized or expected_frequency or active_group
-        display_received = received_frequency_normalized or normalized_frequency or "<vacía>"
+        display_received = received_frequency_normalized or frequency or "<vacía>"
         message = f"La frecuencia esperada para esta solicitud es {display_expected}."
         logger.info("Frecuencia fuera de rango intent=%s freq=%s esperado=%s", phase_intent, display_received, display_expected)
         controller_text = feedback_text = message
@@ -257,15 +403,19 @@ async def analyze_audio(
     next_phase_id = (response_metadata.get("nextPhase") or response_metadata.get("next_phase")) if response_metadata else None
     transitioned = False
     if not next_phase_id and allow_response:
-        transitions = current_phase.get("transitions")
-        candidate = (transitions.get("onSuccess") or transitions.get("success")) if isinstance(transitions, Mapping) else None
+        transitions = view.phase_transitions
+        candidate = transitions.get("onSuccess") or transitions.get("success")
         if isinstance(candidate, str) and candidate.strip():
             next_phase_id = candidate.strip()
     if next_phase_id:
-        phase_map = session_context.get("phase_map")
-        next_phase = phase_map.get(next_phase_id) if isinstance(phase_map, Mapping) else None
+        next_phase = view.phase_map.get(next_phase_id)
         if isinstance(next_phase, Mapping):
-            logger.info("Transición automática de fase session=%s de=%s a=%s", session_id, current_phase.get("id"), next_phase_id)
+            logger.info(
+                "Transición automática de fase session=%s de=%s a=%s",
+                session_str,
+                view.phase_id,
+                next_phase_id,
+            )
             session_context["phase_id"] = next_phase_id
             session_context["phase"] = next_phase
             transitioned = True
@@ -276,25 +426,25 @@ async def analyze_audio(
             else:
                 session_context.pop("session_completed", None)
     if not transitioned:
-        phase_transitions = current_phase.get("transitions") if isinstance(current_phase, Mapping) else None
-        has_followup_phase = False
-        if isinstance(phase_transitions, Mapping):
-            for transition_target in phase_transitions.values():
-                if isinstance(transition_target, str) and transition_target.strip():
-                    has_followup_phase = True
-                    break
+        has_followup_phase = any(
+            isinstance(transition_target, str) and transition_target.strip()
+            for transition_target in view.phase_transitions.values()
+        )
         if current_phase_marks_completion or not has_followup_phase:
             session_context["session_completed"] = True
         else:
             session_context.pop("session_completed", None)
 
+    # phase_id / session_completed may have changed above; rebuild the header once.
+    turn_log.base_header = None
+
     # Record what the "controller" said and keep the turn history bounded.
     controller_turn = {
         "role": "controller",
         "text": controller_text,
         "feedback": feedback_text,
         "allow_response": allow_response,
-        "phase_id": session_context.get("phase_id"),
+        "phase_id": session_context["phase_id"],
     }
     if response_intent:
         controller_turn["intent"] = response_intent
@@ -304,50 +454,77 @@ async def analyze_audio(
         controller_turn["score"] = response_score
     if response_metadata:
         controller_turn["metadata"] = response_metadata
-    if llm_outcome is not None:
-        controller_turn["llm_raw"] = llm_outcome.raw_response
-
-    await save_turn(controller_turn)
 
-    # Save phase score to database if available
-    if response_score is not None:
-        current_phase_id = session_context.get("phase_id") or "unknown"
+    # Mirror what will be sent to the UI and Polly into logs for support.
+    if transcript_prefix is not None:
+        transcript_logger.info(
+            "controller | %s | intent=%s | phase=%s | allow_response=%s | text=%s",
+            transcript_prefix,
+            controller_turn.get("intent"),
+            controller_turn["phase_id"],
+            allow_response,
+            controller_text,
+        )
 
-        # If frequency was incorrect, only track the frequency error (don't penalize the phase)
-        if not is_valid_frequency:
-            frequency_error_score = PhaseScore(
+    async def save_score() -> None:
+        """Record the phase score, or only the frequency error on a wrong frequency."""
+        if response_score is None:
+            return
+        current_phase_id = session_context["phase_id"] or "unknown"
+        db_session.add(
+            PhaseScore(
                 training_session_id=session_id,
                 user_id=_current_user.id,
-                phase_id="frequency_usage_error",
-                score=0.0,
+                phase_id=(
+                    current_phase_id if is_valid_frequency else "frequency_usage_error"
+                ),
+                score=response_score if is_valid_frequency else 0.0,
                 feedback=feedback_text,
             )
-            db_session.add(frequency_error_score)
-            await db_session.commit()
-            logger.info("Error de frecuencia registrado session=%s phase_id=%s", session_id, current_phase_id)
+        )
+        await db_session.commit()
+        if is_valid_frequency:
+            logger.info(
+                "Puntuación guardada session=%s phase_id=%s score=%.2f",
+                session_str,
+                current_phase_id,
+                response_score,
+            )
         else:
-            # Valid frequency: save the actual phase score
-            phase_score = PhaseScore(
-                training_session_id=session_id,
-                user_id=_current_user.id,
-                phase_id=current_phase_id,
-                score=response_score,
-                feedback=feedback_text,
+            logger.info(
+                "Error de frecuencia registrado session=%s phase_id=%s",
+                session_str,
+                current_phase_id,
             )
-            db_session.add(phase_score)
-            await db_session.commit()
-            logger.info("Puntuación guardada session=%s phase_id=%s score=%.2f", session_id, current_phase_id, response_score)
 
-    # Mirror what will be sent to the UI and Polly into logs for support.
-    transcript_logger.info("controller | session=%s | frequency=%s | intent=%s | phase=%s | allow_response=%s | text=%s", session_id, frequency, controller_turn.get("intent"), controller_turn.get("phase_id"), allow_response, controller_text)
-
-    audio_url = await synthesize_controller_audio(session_id, controller_text, allow_response)
+    async def save_turns() -> None:
+        """Append both turns; the raw LLM output is kept in S3 and only referenced here.
+
+        Every stored turn is rewritten on each append, so inlining the raw output would
+        grow every later write and context read.
+        """
+        if llm_outcome is not None:
+            llm_raw_ref = await _persist_llm_raw(session_id, llm_outcome.raw_response)
+            if llm_raw_ref:
+                controller_turn["llm_raw_ref"] = llm_raw_ref
+        turn_log.record(controller_turn)
+        await turn_log.flush()
+
+    # The turn append, the score commit and the readback are independent.
+    _, _, audio_url = await asyncio.gather(
+        save_turns(),
+        save_score(),
+        synthesize_controller_audio(session_id, controller_text, allow_response),
+    )
 
-    return {
-        "session_id": str(session_id),
-        "frequency": frequency,
-        "audio_url": audio_url,
-        "controller_text": controller_text if allow_response and controller_text else None,
-        "feedback": feedback_text,
-        "session_completed": bool(session_context.get("session_completed")),
-    }
+    # Returning the response directly skips FastAPI's jsonable_encoder pass.
+    return ORJSONResponse(
+        {
+            "session_id": session_id,
+            "frequency": frequency,
+            "audio_url": audio_url,
+            "controller_text": controller_text if allow_response and controller_text else None,
+            "feedback": feedback_text,
+            "session_completed": bool(session_context.get("session_completed")),
+        }
+    )
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select
+from sqlalchemy.orm import load_only, noload
 
 from app.config.settings import settings
-from app.controllers.dependencies import SessionDep
+from app.controllers.dependencies import SessionDep, invalidate_cached_user
 from app.models.user import User as UserModel
 from app.telemetry import increment_login
 from app.services import EmailServiceError, send_email
@@ -14,6 +16,7 @@ from app.utils import (
     create_access_token,
     generate_temporary_password,
     hash_password,
+    password_needs_rehash,
     verify_password,
 )
 from app.views import (
@@ -26,6 +29,18 @@ from app.views import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_LOGIN_COLUMNS = load_only(
+    UserModel.id,
+    UserModel.password_hash,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.account_type,
+)
+_FORGOT_PASSWORD_COLUMNS = load_only(UserModel.id, UserModel.email, UserModel.first_name)
+
+# Verified against when the email is unknown so both failure paths cost one hash check.
+_DUMMY_PASSWORD_HASH = hash_password(generate_temporary_password())
+
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
@@ -34,16 +49,27 @@ async def login(
 ) -> TokenResponse:
     """Validate credentials and issue a JWT access token."""
 
+    # The school is joined eagerly by the relationship; skip the unused columns
+    # (notably the inline photo) so login only transfers what the token needs.
     result = await session.execute(
-        select(UserModel).where(UserModel.email == payload.email)
+        select(UserModel)
+        .options(_LOGIN_COLUMNS)
+        .where(UserModel.email_lower == payload.email.strip().lower())
+        .limit(1)
     )
     user = result.scalar_one_or_none()
 
-    if not user:
+    # Password hashing is CPU-bound and releases the GIL, so run it off the event loop.
+    password_hash = user.password_hash if user else _DUMMY_PASSWORD_HASH
+    password_ok = await run_in_threadpool(verify_password, payload.password, password_hash)
+    if not user or not password_ok:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    if not verify_password(payload.password, user.password_hash):
-        raise HTTPException(status_code=401, detail="Invalid email or password")
+    # Upgrade legacy PBKDF2 (or outdated Argon2) hashes while the plain password is at hand.
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await run_in_threadpool(hash_password, payload.password)
+        await session.commit()
+        invalidate_cached_user(user.id)
 
     access_token = create_access_token(subject=str(user.id), user=user)
     expires_in = settings.security.access_token_expires_minutes * 60
@@ -69,7 +95,10 @@ async def forgot_password(
     """Generate a temporary password and email it to the requester."""
 
     result = await session.execute(
-        select(UserModel).where(UserModel.email == payload.email)
+        select(UserModel)
+        .options(_FORGOT_PASSWORD_COLUMNS, noload(UserModel.school))
+        .where(UserModel.email_lower == payload.email.strip().lower())
+        .limit(1)
     )
     user = result.scalar_one_or_none()
 
@@ -80,7 +109,7 @@ async def forgot_password(
         )
 
     temporary_password = generate_temporary_password()
-    user.password_hash = hash_password(temporary_password)
+    user.password_hash = await run_in_threadpool(hash_password, temporary_password)
 
     subject = "Recuperación de contraseña"
     body = (
@@ -101,6 +130,7 @@ async def forgot_password(
         ) from exc
 
     await session.commit()
+    invalidate_cached_user(user.id)
     return ForgotPasswordResponse(
         exists=True,
         message="Se envió una contraseña temporal al correo registrado.",
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
@@ -9,41 +12,133 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_session
+from app.database import ReadSessionFactory, get_read_session, get_session
 from app.models.user import User as UserModel
 from app.utils import AuthenticationError, decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+
+_USER_CACHE_TTL_SECONDS = 60.0
+_USER_CACHE_MAX_ENTRIES = 10_000
+_user_cache: OrderedDict[int, tuple[float, UserModel]] = OrderedDict()
+
+
+def _get_cached_user(user_id: int) -> UserModel | None:
+    """Return a recently loaded user, dropping the entry once it expires."""
+
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, user = entry
+    if expires_at < time.monotonic():
+        _user_cache.pop(user_id, None)
+        return None
+    _user_cache.move_to_end(user_id)
+    return user
+
+
+def _cache_user(user: UserModel) -> None:
+    """Remember a user for point lookups, evicting the least recently used."""
+
+    _user_cache[user.id] = (time.monotonic() + _USER_CACHE_TTL_SECONDS, user)
+    _user_cache.move_to_end(user.id)
+    while len(_user_cache) > _USER_CACHE_MAX_ENTRIES:
+        _user_cache.popitem(last=False)
+
+
+# Verified tokens map to their subject so repeat requests skip the JWT signature
+# check; entries never outlive the token's own expiry.
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+
+def _get_cached_token_subject(token: str) -> int | None:
+    """Return the user id of a recently verified token while it is fresh."""
+
+    entry = _token_cache.get(token)
+    if entry is None:
+        return None
+    expires_at, user_id = entry
+    if expires_at < time.monotonic():
+        _token_cache.pop(token, None)
+        return None
+    _token_cache.move_to_end(token)
+    return user_id
+
+
+def _cache_token_subject(token: str, user_id: int, token_expires_at: datetime) -> None:
+    """Remember a verified token, bounded by both the cache TTL and the token expiry."""
+
+    remaining = (token_expires_at - datetime.now(timezone.utc)).total_seconds()
+    ttl = min(_TOKEN_CACHE_TTL_SECONDS, remaining)
+    if ttl <= 0:
+        return
+    _token_cache[token] = (time.monotonic() + ttl, user_id)
+    _token_cache.move_to_end(token)
+    while len(_token_cache) > _TOKEN_CACHE_MAX_ENTRIES:
+        _token_cache.popitem(last=False)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Forget a cached user so the next request reloads it from the database."""
+
+    _user_cache.pop(user_id, None)
+
+
+def invalidate_cached_users() -> None:
+    """Forget every cached user, e.g. after a school they embed changes."""
+
+    _user_cache.clear()
 
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    session: SessionDep,
 ) -> UserModel:
     """Resolve and validate the user referenced by the bearer token."""
 
-    try:
-        payload = decode_access_token(token)
-        user_id = int(payload.sub)
-    except (AuthenticationError, ValueError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-        ) from None
+    user_id = _get_cached_token_subject(token)
+    if user_id is None:
+        try:
+            payload = decode_access_token(token)
+            user_id = int(payload.sub)
+        except (AuthenticationError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+            ) from None
+        _cache_token_subject(token, user_id, payload.exp)
+
+    cached_user = _get_cached_user(user_id)
+    if cached_user is not None:
+        return cached_user
 
-    result = await session.execute(select(UserModel).where(UserModel.id == user_id))
-    user = result.scalar_one_or_none()
+    # A short-lived session returns its connection right after the lookup instead
+    # of holding a second pooled connection for the rest of the request.
+    async with ReadSessionFactory() as session:
+        result = await session.execute(select(UserModel).where(UserModel.id == user_id))
+        user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
+    _cache_user(user)
     return user
 
 
 CurrentUserDep = Annotated[UserModel, Depends(get_current_user)]
 
 
-__all__ = ["get_current_user", "oauth2_scheme", "SessionDep", "CurrentUserDep"]
+__all__ = [
+    "get_current_user",
+    "invalidate_cached_user",
+    "invalidate_cached_users",
+    "oauth2_scheme",
+    "SessionDep",
+    "ReadSessionDep",
+    "CurrentUserDep",
+]
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+
+import orjson
 from fastapi import APIRouter, HTTPException, Response, status
-from sqlalchemy import func, select
+from sqlalchemy import and_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
-from app.controllers.dependencies import CurrentUserDep, SessionDep
+from app.controllers.dependencies import CurrentUserDep, ReadSessionDep, SessionDep
 from app.models.group import Group
 from app.models.group_membership import (
     GroupMembership,
@@ -25,10 +31,66 @@ from app.views import (
 
 router = APIRouter(prefix="/groups", tags=["groups"])
 
+# Encoded list_groups responses per (user, account type). Any group or
+# membership write clears the whole cache, since one change can alter the
+# lists of every member; the generation counter stops a query that was in
+# flight during a write from caching its stale result. The cache lives in
+# each worker process and a write only clears the worker that handled it, so
+# with WEB_CONCURRENCY > 1 other workers may serve the old list until the
+# short TTL runs out.
+_GROUP_LIST_CACHE_TTL_SECONDS = 10.0
+_GROUP_LIST_CACHE_MAX_ENTRIES = 1024
+_group_list_cache: OrderedDict[tuple[int, AccountType], tuple[float, bytes]] = OrderedDict()
+_group_list_generation = 0
+
+
+def _get_cached_group_list(key: tuple[int, AccountType]) -> bytes | None:
+    """Return the encoded group list for the user while it is fresh."""
+
+    entry = _group_list_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at < time.monotonic():
+        _group_list_cache.pop(key, None)
+        return None
+    _group_list_cache.move_to_end(key)
+    return body
+
+
+def _cache_group_list(key: tuple[int, AccountType], body: bytes, generation: int) -> None:
+    """Remember an encoded group list unless a write happened while it was loaded."""
+
+    if generation != _group_list_generation:
+        return
+    _group_list_cache[key] = (time.monotonic() + _GROUP_LIST_CACHE_TTL_SECONDS, body)
+    _group_list_cache.move_to_end(key)
+    while len(_group_list_cache) > _GROUP_LIST_CACHE_MAX_ENTRIES:
+        _group_list_cache.popitem(last=False)
+
+
+def invalidate_cached_group_lists() -> None:
+    """Forget every cached group list after a group or membership write."""
+
+    global _group_list_generation
+    _group_list_generation += 1
+    _group_list_cache.clear()
+
+
+# Built once so every rename check reuses the same cached compiled statement.
+_DUPLICATE_GROUP_NAME = (
+    select(Group.id)
+    .where(
+        Group.id != bindparam("group_id"),
+        Group.school_id == bindparam("school_id"),
+        func.lower(Group.name) == bindparam("name_lower"),
+    )
+    .limit(1)
+)
+
 
 async def _get_group_or_404(session: SessionDep, group_id: int) -> Group:
-    result = await session.execute(select(Group).where(Group.id == group_id))
-    group = result.scalar_one_or_none()
+    group = await session.get(Group, group_id)
     if not group:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -37,18 +99,31 @@ async def _get_group_or_404(session: SessionDep, group_id: int) -> Group:
     return group
 
 
-async def _get_membership(
+async def _get_group_and_membership_or_404(
     session: SessionDep,
     group_id: int,
     user_id: int,
-) -> GroupMembership | None:
+) -> tuple[Group, GroupMembership | None]:
+    """Load the group and the user's membership in it with a single outer join."""
+
     result = await session.execute(
-        select(GroupMembership).where(
-            GroupMembership.group_id == group_id,
-            GroupMembership.user_id == user_id,
+        select(Group, GroupMembership)
+        .outerjoin(
+            GroupMembership,
+            and_(
+                GroupMembership.group_id == Group.id,
+                GroupMembership.user_id == user_id,
+            ),
         )
+        .where(Group.id == group_id)
     )
-    return result.scalar_one_or_none()
+    row = result.first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Group not found",
+        )
+    return row[0], row[1]
 
 
 def _serialize_group(group: Group, membership: GroupMembership | None) -> GroupResponse:
@@ -97,35 +172,30 @@ def _ensure_instructor(current_user: CurrentUserDep) -> None:
         )
 
 
-@router.get("/", response_model=list[GroupResponse])
-async def list_groups(
+async def _load_group_list(
     current_user: CurrentUserDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> list[GroupResponse]:
-    """Return groups that belong to the instructor or where the student is a member."""
+    """Query the groups list_groups returns for the user."""
 
     if current_user.account_type == AccountType.INSTRUCTOR:
+        # Owned groups plus the instructor's own membership row, if any, in one query.
         result = await session.execute(
-            select(Group)
+            select(Group, GroupMembership)
+            .outerjoin(
+                GroupMembership,
+                and_(
+                    GroupMembership.group_id == Group.id,
+                    GroupMembership.user_id == current_user.id,
+                ),
+            )
             .where(Group.owner_id == current_user.id)
             .order_by(Group.name)
+            .options(raiseload("*"))
         )
-        groups = result.scalars().all()
-        if not groups:
-            return []
-        membership_rows = await session.execute(
-            select(GroupMembership).where(
-                GroupMembership.group_id.in_([group.id for group in groups]),
-                GroupMembership.user_id == current_user.id,
-            )
-        )
-        membership_map = {
-            membership.group_id: membership
-            for membership in membership_rows.scalars().all()
-        }
         return [
-            _serialize_group(group, membership_map.get(group.id))
-            for group in groups
+            _serialize_group(group, membership)
+            for group, membership in result.all()
         ]
 
     result = await session.execute(
@@ -133,6 +203,7 @@ async def list_groups(
         .join(GroupMembership, GroupMembership.group_id == Group.id)
         .where(GroupMembership.user_id == current_user.id)
         .order_by(Group.name)
+        .options(raiseload("*"))
     )
     rows = result.all()
     return [
@@ -141,16 +212,33 @@ async def list_groups(
     ]
 
 
+@router.get("/", response_model=list[GroupResponse])
+async def list_groups(
+    current_user: CurrentUserDep,
+    session: ReadSessionDep,
+) -> Response:
+    """Return groups that belong to the instructor or where the student is a member."""
+
+    # Hits are served as pre-encoded JSON, skipping the query and the model pass.
+    cache_key = (current_user.id, current_user.account_type)
+    body = _get_cached_group_list(cache_key)
+    if body is None:
+        generation = _group_list_generation
+        groups = await _load_group_list(current_user, session)
+        body = orjson.dumps([group.model_dump(mode="json", by_alias=True) for group in groups])
+        _cache_group_list(cache_key, body, generation)
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/users/{user_id}", response_model=list[GroupResponse])
 async def list_groups_for_user(
     user_id: int,
     current_user: CurrentUserDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> list[GroupResponse]:
     """Allow instructors to inspect the groups that belong to a specific user."""
 
-    result = await session.execute(select(UserModel).where(UserModel.id == user_id))
-    target_user = result.scalar_one_or_none()
+    target_user = await session.get(UserModel, user_id)
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -176,12 +264,12 @@ async def list_groups_for_user(
     }
 
     if target_user.account_type == AccountType.INSTRUCTOR:
-        owner_rows = await session.execute(
-            select(Group).where(Group.owner_id == target_user.id)
-        )
+        owned_query = select(Group).where(Group.owner_id == target_user.id)
+        if groups_map:
+            # Let the database skip groups already covered by a real membership.
+            owned_query = owned_query.where(Group.id.notin_(list(groups_map)))
+        owner_rows = await session.execute(owned_query)
         for group in owner_rows.scalars().all():
-            if group.id in groups_map:
-                continue
             pseudo_membership = GroupMembership(
                 group_id=group.id,
                 user_id=target_user.id,
@@ -217,27 +305,29 @@ async def create_group(
 
     name = payload.name.strip()
     description = payload.description.strip() if payload.description else None
-    duplicate = await session.execute(
-        select(func.count(Group.id)).where(
-            func.lower(Group.name) == name.lower(),
-            Group.school_id == current_user.school_id,
+    # The (school_id, lower(name)) unique index turns a duplicate into "no row
+    # returned", so the check and the insert share one round-trip.
+    inserted = await session.execute(
+        pg_insert(Group)
+        .values(
+            name=name,
+            description=description,
+            school_id=current_user.school_id,
+            owner_id=current_user.id,
         )
+        .on_conflict_do_nothing()
+        .returning(Group)
     )
-    if duplicate.scalar_one() > 0:
+    group = inserted.scalar_one_or_none()
+    if group is None:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Another group with this name already exists in your academy",
         )
 
-    group = Group(
-        name=name,
-        description=description,
-        school_id=current_user.school_id,
-        owner_id=current_user.id,
-    )
-    session.add(group)
     owner_membership = GroupMembership(
-        group=group,
+        group_id=group.id,
         user_id=current_user.id,
         role=GroupRole.INSTRUCTOR,
         status=GroupMembershipStatus.ACTIVE,
@@ -254,8 +344,7 @@ async def create_group(
             detail="Unable to create group",
         ) from exc
 
-    await session.refresh(group)
-    await session.refresh(owner_membership)
+    invalidate_cached_group_lists()
     return _serialize_group(group, owner_membership)
 
 
@@ -263,12 +352,13 @@ async def create_group(
 async def get_group(
     group_id: int,
     current_user: CurrentUserDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> GroupResponse:
     """Return a single group if it belongs to the current user."""
 
-    group = await _get_group_or_404(session, group_id)
-    membership = await _get_membership(session, group_id, current_user.id)
+    group, membership = await _get_group_and_membership_or_404(
+        session, group_id, current_user.id
+    )
     if membership is None and group.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -296,7 +386,9 @@ async def update_group(
 ) -> GroupResponse:
     """Update group metadata (name/description)."""
 
-    group = await _get_group_or_404(session, group_id)
+    group, membership = await _get_group_and_membership_or_404(
+        session, group_id, current_user.id
+    )
     if group.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -312,13 +404,14 @@ async def update_group(
                 detail="Name cannot be empty",
             )
         duplicate = await session.execute(
-            select(Group).where(
-                Group.id != group.id,
-                Group.school_id == group.school_id,
-                func.lower(Group.name) == new_name.lower(),
-            )
+            _DUPLICATE_GROUP_NAME,
+            {
+                "group_id": group.id,
+                "school_id": group.school_id,
+                "name_lower": new_name.lower(),
+            },
         )
-        if duplicate.scalar_one_or_none():
+        if duplicate.scalar_one_or_none() is not None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Another group in this academy already uses that name",
@@ -331,9 +424,8 @@ async def update_group(
 
     if updated:
         await session.commit()
-        await session.refresh(group)
+        invalidate_cached_group_lists()
 
-    membership = await _get_membership(session, group_id, current_user.id)
     if membership is None:
         membership = GroupMembership(
             group_id=group.id,
@@ -363,6 +455,7 @@ async def delete_group(
 
     await session.delete(group)
     await session.commit()
+    invalidate_cached_group_lists()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -370,23 +463,26 @@ async def delete_group(
 async def list_group_members(
     group_id: int,
     current_user: CurrentUserDep,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> list[GroupMemberResponse]:
     """Return members and pending invitations for a group."""
 
-    group = await _get_group_or_404(session, group_id)
-    membership = await _get_membership(session, group_id, current_user.id)
+    group, membership = await _get_group_and_membership_or_404(
+        session, group_id, current_user.id
+    )
     if membership is None and group.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You do not belong to this group",
         )
 
+    # raiseload also drops User.school's default joined load; only user columns are read.
     result = await session.execute(
         select(GroupMembership, UserModel)
         .join(UserModel, UserModel.id == GroupMembership.user_id)
         .where(GroupMembership.group_id == group_id)
         .order_by(UserModel.first_name, UserModel.last_name)
+        .options(raiseload("*"))
     )
     rows = result.all()
     return [
@@ -408,50 +504,65 @@ async def add_group_member(
 ) -> GroupMembershipResponse:
     """Allow an instructor to add a student immediately."""
 
-    group = await _get_group_or_404(session, group_id)
+    # The group and the invariants on the student come back in one row; the
+    # left join leaves the student columns empty when the user does not exist.
+    result = await session.execute(
+        select(Group, UserModel.account_type, UserModel.school_id)
+        .outerjoin(UserModel, UserModel.id == payload.userId)
+        .where(Group.id == group_id)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Group not found",
+        )
+    group, student_account_type, student_school_id = row
     if group.owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only the group owner can add students",
         )
-
-    result = await session.execute(
-        select(UserModel).where(UserModel.id == payload.userId)
-    )
-    student = result.scalar_one_or_none()
-    if not student:
+    if student_account_type is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Student not found",
         )
-    if student.account_type != AccountType.STUDENT:
+    if student_account_type != AccountType.STUDENT:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Only students can join a group",
         )
-    if student.school_id != group.school_id:
+    if student_school_id != group.school_id:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Student must belong to the same academy as the group",
         )
 
-    membership = await _get_membership(session, group_id, student.id)
-    if membership:
+    # The (group_id, user_id) unique constraint turns an existing membership
+    # into "no row returned", so the duplicate check cannot race the insert.
+    inserted = await session.execute(
+        pg_insert(GroupMembership)
+        .values(
+            group_id=group.id,
+            user_id=payload.userId,
+            role=GroupRole.STUDENT,
+            status=GroupMembershipStatus.ACTIVE,
+            invited_by_id=current_user.id,
+        )
+        .on_conflict_do_nothing()
+        .returning(GroupMembership)
+    )
+    membership = inserted.scalar_one_or_none()
+    if membership is None:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Student already belongs to this group",
         )
 
-    membership = GroupMembership(
-        group_id=group.id,
-        user_id=student.id,
-        role=GroupRole.STUDENT,
-        status=GroupMembershipStatus.ACTIVE,
-        invited_by_id=current_user.id,
-    )
-    session.add(membership)
     await session.commit()
-    await session.refresh(membership)
+    invalidate_cached_group_lists()
     return GroupMembershipResponse.model_validate(membership)
 
 
@@ -467,8 +578,9 @@ async def remove_group_member(
 ) -> Response:
     """Remove a student or allow members to leave."""
 
-    group = await _get_group_or_404(session, group_id)
-    membership = await _get_membership(session, group_id, user_id)
+    group, membership = await _get_group_and_membership_or_404(
+        session, group_id, user_id
+    )
     if not membership:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -483,6 +595,7 @@ async def remove_group_member(
             )
         await session.delete(membership)
         await session.commit()
+        invalidate_cached_group_lists()
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     if group.owner_id != current_user.id:
@@ -498,4 +611,5 @@ async def remove_group_member(
 
     await session.delete(membership)
     await session.commit()
+    invalidate_cached_group_lists()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,18 +2,16 @@
 
 from typing import Annotated, List
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Query, status
+from sqlalchemy import insert, select
 
-from app.database import get_session
+from app.controllers.dependencies import ReadSessionDep, SessionDep
 from app.models.hello import HelloMessage as HelloMessageModel
-from app.views import HelloMessageCreate, HelloMessageRead
+from app.views import HelloMessageBulkCreate, HelloMessageCreate, HelloMessageRead
 
 router = APIRouter(prefix="/hello", tags=["hello"])
 
 
-SessionDep = Annotated[AsyncSession, Depends(get_session)]
 LimitQuery = Annotated[int, Query(ge=1, le=100)]
 
 
@@ -25,13 +23,32 @@ async def create_hello_message(
     db_message = HelloMessageModel(message=payload.message)
     session.add(db_message)
     await session.commit()
-    await session.refresh(db_message)
     return HelloMessageRead.model_validate(db_message)
 
 
+@router.post(
+    "/bulk",
+    response_model=List[HelloMessageRead],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_hello_messages(
+    payload: HelloMessageBulkCreate,
+    session: SessionDep,
+) -> List[HelloMessageRead]:
+    # One multi-row INSERT ... RETURNING instead of an INSERT per message.
+    result = await session.execute(
+        insert(HelloMessageModel)
+        .values([{"message": message} for message in payload.messages])
+        .returning(HelloMessageModel)
+    )
+    messages = result.scalars().all()
+    await session.commit()
+    return [HelloMessageRead.model_validate(row) for row in messages]
+
+
 @router.get("/", response_model=List[HelloMessageRead])
 async def list_hello_messages(
-    session: SessionDep,
+    session: ReadSessionDep,
     limit: LimitQuery = 10,
 ) -> List[HelloMessageRead]:
     result = await session.execute(
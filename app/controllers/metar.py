@@ -1,5 +1,10 @@
 """METAR weather data proxy endpoints."""
 
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+
 import httpx
 from fastapi import APIRouter, HTTPException, status
 
@@ -7,6 +12,96 @@ from app.views.metar import MetarResponse
 
 router = APIRouter(prefix="/metar", tags=["metar"])
 
+# Shared across requests so the TCP/TLS connection to aviationweather.gov is reused.
+_client = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+
+# METARs are issued every 30-60 minutes, so a short TTL collapses bursts of
+# lookups for the same airport into one upstream fetch.
+_METAR_CACHE_TTL_SECONDS = 120.0
+_METAR_CACHE_MAX_ENTRIES = 1024
+_metar_cache: OrderedDict[str, tuple[float, MetarResponse]] = OrderedDict()
+# Concurrent misses for the same airport wait for a single upstream request.
+_fetch_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def _get_cached_metar(icao_code: str) -> MetarResponse | None:
+    """Return the cached METAR for the airport while it is fresh."""
+
+    entry = _metar_cache.get(icao_code)
+    if entry is None:
+        return None
+    expires_at, metar = entry
+    if expires_at < time.monotonic():
+        _metar_cache.pop(icao_code, None)
+        return None
+    _metar_cache.move_to_end(icao_code)
+    return metar
+
+
+def _cache_metar(icao_code: str, metar: MetarResponse) -> None:
+    """Remember a METAR, evicting the least recently used airport."""
+
+    _metar_cache[icao_code] = (time.monotonic() + _METAR_CACHE_TTL_SECONDS, metar)
+    _metar_cache.move_to_end(icao_code)
+    while len(_metar_cache) > _METAR_CACHE_MAX_ENTRIES:
+        _metar_cache.popitem(last=False)
+
+
+def _fetch_lock(icao_code: str) -> asyncio.Lock:
+    """Return the lock serializing upstream fetches for the airport."""
+
+    lock = _fetch_locks.get(icao_code)
+    if lock is None:
+        lock = asyncio.Lock()
+        _fetch_locks[icao_code] = lock
+    return lock
+
+
+async def close_metar_client() -> None:
+    """Close the pooled Aviation Weather connections on application shutdown."""
+
+    await _client.aclose()
+
+
+async def _fetch_metar(icao_code: str) -> MetarResponse:
+    """Request the latest METAR from Aviation Weather, mapping failures to HTTP errors."""
+
+    try:
+        response = await _client.get(
+            f"https://aviationweather.gov/api/data/metar?ids={icao_code}&format=json",
+        )
+        response.raise_for_status()
+
+        data = response.json()
+
+        if not data or len(data) == 0:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No METAR data available for {icao_code}",
+            )
+
+        return MetarResponse(**data[0])
+
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Error fetching METAR data: {str(e)}",
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Unable to connect to Aviation Weather API: {str(e)}",
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Invalid response from Aviation Weather API: {str(e)}",
+        )
+
 
 @router.get("/{icao_code}", response_model=MetarResponse)
 async def get_metar(icao_code: str) -> MetarResponse:
@@ -25,36 +120,15 @@ async def get_metar(icao_code: str) -> MetarResponse:
     """
     icao_code = icao_code.upper()
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://aviationweather.gov/api/data/metar?ids={icao_code}&format=json",
-                timeout=10.0,
-            )
-            response.raise_for_status()
-
-            data = response.json()
+    cached = _get_cached_metar(icao_code)
+    if cached is not None:
+        return cached
 
-            if not data or len(data) == 0:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"No METAR data available for {icao_code}",
-                )
-
-            return MetarResponse(**data[0])
-
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Error fetching METAR data: {str(e)}",
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Unable to connect to Aviation Weather API: {str(e)}",
-            )
-        except ValueError as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Invalid response from Aviation Weather API: {str(e)}",
-            )
+    async with _fetch_lock(icao_code):
+        # Another request may have fetched it while this one waited.
+        cached = _get_cached_metar(icao_code)
+        if cached is not None:
+            return cached
+        metar = await _fetch_metar(icao_code)
+        _cache_metar(icao_code, metar)
+        return metar
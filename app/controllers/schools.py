@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import time
+
+import orjson
 from fastapi import APIRouter, HTTPException, Response, status
-from sqlalchemy import func, or_, select
+from sqlalchemy import bindparam, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 
-from app.controllers.dependencies import CurrentUserDep, SessionDep
+from app.controllers.dependencies import (
+    CurrentUserDep,
+    ReadSessionDep,
+    SessionDep,
+    invalidate_cached_users,
+)
+from app.controllers.groups import invalidate_cached_group_lists
 from app.models.school import School as SchoolModel
 from app.models.user import AccountType, User as UserModel
 from app.views import (
@@ -18,6 +29,56 @@ from app.views import (
 
 router = APIRouter(prefix="/schools", tags=["schools"])
 
+# The school list is the same for every caller and rarely changes, so the
+# encoded response is kept until it expires or a school write clears it. The
+# generation counter stops a query in flight during a write from caching.
+# A write only clears the worker process that handled it, so the TTL bounds
+# how long other workers keep serving the old list.
+_SCHOOL_LIST_CACHE_TTL_SECONDS = 30.0
+_school_list_cache: tuple[float, bytes] | None = None
+_school_list_generation = 0
+
+
+def _get_cached_school_list() -> bytes | None:
+    """Return the encoded school list while it is fresh."""
+
+    if _school_list_cache is None:
+        return None
+    expires_at, body = _school_list_cache
+    if expires_at < time.monotonic():
+        return None
+    return body
+
+
+def _cache_school_list(body: bytes, generation: int) -> None:
+    """Remember the encoded school list unless a write happened while it was loaded."""
+
+    global _school_list_cache
+    if generation == _school_list_generation:
+        _school_list_cache = (time.monotonic() + _SCHOOL_LIST_CACHE_TTL_SECONDS, body)
+
+
+def invalidate_cached_school_list() -> None:
+    """Forget the cached school list after a school write."""
+
+    global _school_list_cache, _school_list_generation
+    _school_list_generation += 1
+    _school_list_cache = None
+
+
+# Built once so every update check reuses the same cached compiled statement.
+_DUPLICATE_SCHOOL = (
+    select(SchoolModel.id)
+    .where(
+        SchoolModel.id != bindparam("school_id"),
+        or_(
+            func.lower(SchoolModel.name) == bindparam("name_lower"),
+            func.lower(SchoolModel.value) == bindparam("value_lower"),
+        ),
+    )
+    .limit(1)
+)
+
 
 @router.post("/", response_model=SchoolResponse, status_code=status.HTTP_201_CREATED)
 async def create_school(
@@ -35,22 +96,22 @@ async def create_school(
             detail="Name, value, and location cannot be empty",
         )
 
-    existing = await session.execute(
-        select(SchoolModel).where(
-            or_(
-                func.lower(SchoolModel.name) == name.lower(),
-                func.lower(SchoolModel.value) == value.lower(),
-            )
-        )
+    # The lower(name)/lower(value) unique indexes turn a duplicate into "no row
+    # returned", so the check and the insert share one round-trip.
+    inserted = await session.execute(
+        pg_insert(SchoolModel)
+        .values(name=name, value=value, location=location)
+        .on_conflict_do_nothing()
+        .returning(SchoolModel)
     )
-    if existing.scalar_one_or_none():
+    school = inserted.scalar_one_or_none()
+    if school is None:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="School with this name or value already exists",
         )
 
-    school = SchoolModel(name=name, value=value, location=location)
-    session.add(school)
     try:
         await session.commit()
     except IntegrityError as exc:
@@ -60,39 +121,49 @@ async def create_school(
             detail="Could not create school",
         ) from exc
 
-    await session.refresh(school)
+    invalidate_cached_school_list()
     return SchoolResponse.model_validate(school)
 
 
 @router.get("/", response_model=list[SchoolResponse])
 async def list_schools(
-    session: SessionDep,
-) -> list[SchoolResponse]:
-    result = await session.execute(select(SchoolModel).order_by(SchoolModel.name))
-    schools = result.scalars().all()
-    return [SchoolResponse.model_validate(school) for school in schools]
+    session: ReadSessionDep,
+) -> Response:
+    # Hits are served as pre-encoded JSON, skipping the query and the model pass.
+    body = _get_cached_school_list()
+    if body is None:
+        generation = _school_list_generation
+        result = await session.execute(select(SchoolModel).order_by(SchoolModel.name))
+        body = orjson.dumps(
+            [
+                SchoolResponse.model_validate(school).model_dump(mode="json", by_alias=True)
+                for school in result.scalars().all()
+            ]
+        )
+        _cache_school_list(body, generation)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{school_id}/students", response_model=list[UserResponse])
 async def list_school_students(
     school_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     _current_user: CurrentUserDep,
 ) -> list[UserResponse]:
     """Return the roster of student accounts for a given school."""
 
-    result = await session.execute(
-        select(SchoolModel).where(SchoolModel.id == school_id)
-    )
-    school = result.scalar_one_or_none()
+    school = await session.get(SchoolModel, school_id)
     if not school:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="School not found",
         )
 
+    # The school is already in the identity map, so selectinload resolves it
+    # without the per-row JOIN that the default joined loader would add.
     students_result = await session.execute(
         select(UserModel)
+        .options(selectinload(UserModel.school))
         .where(
             UserModel.school_id == school_id,
             UserModel.account_type == AccountType.STUDENT,
@@ -106,13 +177,10 @@ async def list_school_students(
 @router.get("/{school_id}", response_model=SchoolResponse)
 async def get_school(
     school_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     _current_user: CurrentUserDep,
 ) -> SchoolResponse:
-    result = await session.execute(
-        select(SchoolModel).where(SchoolModel.id == school_id)
-    )
-    school = result.scalar_one_or_none()
+    school = await session.get(SchoolModel, school_id)
     if not school:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -128,55 +196,48 @@ async def update_school(
     session: SessionDep,
     _current_user: CurrentUserDep,
 ) -> SchoolResponse:
-    result = await session.execute(
-        select(SchoolModel).where(SchoolModel.id == school_id)
-    )
-    school = result.scalar_one_or_none()
+    # Validate the payload before touching the database.
+    new_name = payload.name.strip() if payload.name is not None else None
+    new_value = payload.value.strip() if payload.value is not None else None
+    new_location = payload.location.strip() if payload.location is not None else None
+    if new_name == "":
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Name cannot be empty",
+        )
+    if new_value == "":
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Value cannot be empty",
+        )
+    if new_location == "":
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Location cannot be empty",
+        )
+
+    school = await session.get(SchoolModel, school_id)
     if not school:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="School not found",
         )
 
-    new_name = school.name
-    new_value = school.value
-    new_location = school.location
-    if payload.name is not None:
-        new_name = payload.name.strip()
-        if not new_name:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Name cannot be empty",
-            )
-    if payload.value is not None:
-        new_value = payload.value.strip()
-        if not new_value:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Value cannot be empty",
-            )
-    if payload.location is not None:
-        new_location = payload.location.strip()
-        if not new_location:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Location cannot be empty",
-            )
-    # update location after validation
-    if payload.location is not None:
+    new_name = new_name or school.name
+    new_value = new_value or school.value
+    if new_location is not None:
         school.location = new_location
 
     if payload.name is not None or payload.value is not None:
         dup_query = await session.execute(
-            select(SchoolModel).where(
-                SchoolModel.id != school_id,
-                or_(
-                    func.lower(SchoolModel.name) == new_name.lower(),
-                    func.lower(SchoolModel.value) == new_value.lower(),
-                ),
-            )
+            _DUPLICATE_SCHOOL,
+            {
+                "school_id": school_id,
+                "name_lower": new_name.lower(),
+                "value_lower": new_value.lower(),
+            },
         )
-        if dup_query.scalar_one_or_none():
+        if dup_query.scalar_one_or_none() is not None:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Another school already uses this name or value",
@@ -195,7 +256,9 @@ async def update_school(
             detail="School information conflicts with existing records",
         ) from exc
 
-    await session.refresh(school)
+    invalidate_cached_school_list()
+    # Cached users carry their school, so none of them may keep the old one.
+    invalidate_cached_users()
     return SchoolResponse.model_validate(school)
 
 
@@ -205,10 +268,7 @@ async def delete_school(
     session: SessionDep,
     _current_user: CurrentUserDep,
 ) -> Response:
-    result = await session.execute(
-        select(SchoolModel).where(SchoolModel.id == school_id)
-    )
-    school = result.scalar_one_or_none()
+    school = await session.get(SchoolModel, school_id)
     if not school:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -217,4 +277,8 @@ async def delete_school(
 
     await session.delete(school)
     await session.commit()
+    # Deleting a school cascades to its groups and detaches its users.
+    invalidate_cached_school_list()
+    invalidate_cached_group_lists()
+    invalidate_cached_users()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -5,9 +5,9 @@ from typing import Any, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 
-from app.controllers.dependencies import CurrentUserDep, SessionDep
+from app.controllers.dependencies import CurrentUserDep, ReadSessionDep, SessionDep
 from app.models.phase_score import PhaseScore
 from app.models.user import AccountType, User as UserModel
 from app.services.llm_client import BedrockLlmClient
@@ -17,6 +17,8 @@ router = APIRouter(prefix="/scores", tags=["scores"])
 
 logger = logging.getLogger(__name__)
 
+_LLM_CLIENT = BedrockLlmClient()
+
 
 async def _get_user_or_404(db_session: SessionDep, user_id: int) -> UserModel:
     """Return a user or raise 404."""
@@ -64,7 +66,7 @@ async def _ensure_can_view_user_scores(
 @router.get("/phases")
 async def get_all_phases_scores(
     _current_user: CurrentUserDep,
-    db_session: SessionDep,
+    db_session: ReadSessionDep,
     phase_ids: Optional[str] = Query(None, description="Comma-separated phase IDs to filter"),
     user_id: Optional[int] = Query(
         None,
@@ -153,7 +155,7 @@ async def get_all_phases_scores(
 @router.get("/phase/{phase_id}")
 async def get_phase_scores(
     _current_user: CurrentUserDep,
-    db_session: SessionDep,
+    db_session: ReadSessionDep,
     phase_id: str,
     user_id: Optional[int] = Query(
         None,
@@ -205,7 +207,7 @@ async def get_phase_scores(
 @router.get("/session/{session_id}")
 async def get_session_scores(
     _current_user: CurrentUserDep,
-    db_session: SessionDep,
+    db_session: ReadSessionDep,
     session_id: UUID,
 ) -> dict[str, Any]:
     """Get all phase scores and averages for a training session."""
@@ -239,23 +241,17 @@ async def get_session_scores(
             detail="No scores found for this session",
         )
 
-    # Calculate average score per phase
-    phase_averages_result = await db_session.execute(
-        select(
-            PhaseScore.phase_id,
-            func.avg(PhaseScore.score).label("average_score"),
-            func.count(PhaseScore.id).label("score_count"),
-        )
-        .where(PhaseScore.training_session_id == session_id)
-        .where(PhaseScore.user_id == owner_user_id)
-        .group_by(PhaseScore.phase_id)
-    )
+    # Calculate average score per phase from the rows already fetched above
+    # instead of issuing a second GROUP BY query over the same data.
+    phase_values: dict[str, list[float]] = {}
+    for score in scores:
+        phase_values.setdefault(score.phase_id, []).append(float(score.score))
 
     phase_averages = {}
-    for row in phase_averages_result:
-        phase_averages[row.phase_id] = {
-            "average_score": round(float(row.average_score), 2),
-            "score_count": row.score_count,
+    for phase_id, values in phase_values.items():
+        phase_averages[phase_id] = {
+            "average_score": round(sum(values) / len(values), 2),
+            "score_count": len(values),
         }
 
     # Calculate overall session average
@@ -283,7 +279,7 @@ async def get_session_scores(
 @router.get("/session/{session_id}/summary")
 async def get_session_summary(
     _current_user: CurrentUserDep,
-    db_session: SessionDep,
+    db_session: ReadSessionDep,
     session_id: UUID,
 ) -> dict[str, Any]:
     """Get session scores grouped by phase with LLM-generated summary."""
@@ -343,7 +339,7 @@ async def get_session_summary(
     overall_average = round(sum(all_scores) / len(all_scores), 2) if all_scores else 0.0
 
     # Generate LLM summary
-    llm_client = BedrockLlmClient()
+    llm_client = _LLM_CLIENT
 
     # Build context for LLM
     session_context = f"Sesión de entrenamiento ATC - Promedio general: {overall_average}/100\n\n"
@@ -388,7 +384,7 @@ async def get_session_summary(
 @router.get("/phase/{phase_id}/summary")
 async def get_phase_summary(
     _current_user: CurrentUserDep,
-    db_session: SessionDep,
+    db_session: ReadSessionDep,
     phase_id: str,
     user_id: Optional[int] = Query(
         None,
@@ -421,7 +417,7 @@ async def get_phase_summary(
     average_score = round(sum(all_scores) / len(all_scores), 2) if all_scores else 0.0
 
     # Generate LLM summary
-    llm_client = BedrockLlmClient()
+    llm_client = _LLM_CLIENT
 
     # Build context for LLM
     phase_context = f"Fase: {phase_id}\n"
@@ -5,10 +5,11 @@ from uuid import UUID, uuid4
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import delete, select
 
-from app.controllers.dependencies import CurrentUserDep, SessionDep
+from app.controllers.dependencies import CurrentUserDep, ReadSessionDep, SessionDep
 from app.models.phase_score import PhaseScore
 from app.models.training_context import TrainingContext
 from app.models.user import AccountType, User as UserModel
+from app.services.context_repository import invalidate_cached_context
 from app.views.training_context import (
     LastControllerTurnResponse,
     TrainingContextHistoryItem,
@@ -94,7 +95,7 @@ async def create_flight_context(
 )
 async def get_training_history(
     user_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     current_user: CurrentUserDep,
 ) -> list[TrainingContextHistoryItem]:
     """Return the chronological history of training contexts for the given user.
@@ -137,7 +138,7 @@ async def get_training_history(
 )
 async def get_last_controller_turn(
     training_session_id: UUID,
-    session: SessionDep,
+    session: ReadSessionDep,
     current_user: CurrentUserDep,
 ) -> LastControllerTurnResponse:
     """Get the last controller turn information from a training session.
@@ -246,3 +247,4 @@ async def delete_training_session(
     )
 
     await session.commit()
+    invalidate_cached_context(training_session_id)
@@ -1,16 +1,37 @@
 """Text-to-speech controller backed by Amazon Polly."""
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
 
 from app.config.settings import settings
+from app.services.aws import create_boto3_client
 from app.views import TextToSpeechRequest
 
 router = APIRouter(prefix="/tts", tags=["tts"])
 
-polly_client = boto3.client("polly", region_name=settings.s3.region)
+polly_client = create_boto3_client("polly", region_name=settings.s3.region)
+
+
+def _synthesize_mp3(text: str, voice_id: str) -> bytes:
+    """Call Polly and drain the audio stream; both block on the network."""
+
+    result = polly_client.synthesize_speech(
+        Text=text,
+        VoiceId=voice_id,
+        OutputFormat="mp3",
+        Engine="neural",
+    )
+    audio_stream = result.get("AudioStream")
+    if audio_stream is None:
+        raise HTTPException(
+            status_code=500, detail="Polly returned no audio stream"
+        )
+    try:
+        return audio_stream.read()
+    finally:
+        audio_stream.close()
 
 
 @router.post("/", response_class=Response)
@@ -19,18 +40,7 @@ async def text_to_speech(request: TextToSpeechRequest) -> Response:
 
     try:
         voice_id = request.voice_id or "Mia"
-        result = polly_client.synthesize_speech(
-            Text=request.text,
-            VoiceId=voice_id,
-            OutputFormat="mp3",
-            Engine="neural",
-        )
-        audio_stream = result.get("AudioStream")
-        if audio_stream is None:
-            raise HTTPException(
-                status_code=500, detail="Polly returned no audio stream"
-            )
-        audio_bytes = audio_stream.read()
+        audio_bytes = await run_in_threadpool(_synthesize_mp3, request.text, voice_id)
     except (BotoCoreError, ClientError) as exc:  # pragma: no cover - network call
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Response, status
-from sqlalchemy import select
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.controllers.dependencies import CurrentUserDep, SessionDep
+from app.controllers.dependencies import (
+    CurrentUserDep,
+    ReadSessionDep,
+    SessionDep,
+    invalidate_cached_user,
+)
+from app.controllers.groups import invalidate_cached_group_lists
+from app.database import session_scope
 from app.models.school import School as SchoolModel
 from app.models.user import User as UserModel
 from app.utils import hash_password, verify_password
@@ -31,10 +44,7 @@ async def _get_school_or_404(
     if school_id is None:
         return None
 
-    result = await session.execute(
-        select(SchoolModel).where(SchoolModel.id == school_id)
-    )
-    school = result.scalar_one_or_none()
+    school = await session.get(SchoolModel, school_id)
     if not school:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="School not found"
@@ -42,6 +52,18 @@ async def _get_school_or_404(
     return school
 
 
+async def _email_registered(email: str) -> bool:
+    """Check for an existing account on a dedicated short-lived session."""
+
+    async with session_scope() as lookup_session:
+        result = await lookup_session.execute(
+            select(UserModel.id)
+            .where(UserModel.email_lower == email.strip().lower())
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
+
+
 def _serialize_school(school: SchoolModel | None) -> SchoolResponse | None:
     if school is None:
         return None
@@ -55,17 +77,24 @@ async def register_user(
     payload: UserRegistrationRequest,
     session: SessionDep,
 ) -> UserRegistrationResponse:
-    result = await session.execute(
-        select(UserModel).where(UserModel.email == payload.email)
+    # AsyncSession cannot run queries concurrently, so the duplicate check uses
+    # its own session while the school lookup stays on the request session.
+    email_taken, school = await asyncio.gather(
+        _email_registered(payload.email),
+        _get_school_or_404(session, payload.schoolId),
+        return_exceptions=True,
     )
-    if result.scalar_one_or_none():
+    if isinstance(email_taken, BaseException):
+        raise email_taken
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email address already registered",
         )
+    if isinstance(school, BaseException):
+        raise school
 
-    hashed_password = hash_password(payload.password)
-    school = await _get_school_or_404(session, payload.schoolId)
+    hashed_password = await run_in_threadpool(hash_password, payload.password)
 
     db_user = UserModel(
         email=payload.email,
@@ -78,7 +107,15 @@ async def register_user(
     )
 
     session.add(db_user)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as exc:
+        # A concurrent registration took the same email between check and insert.
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Email address already registered",
+        ) from exc
     await session.refresh(db_user)
 
     return UserRegistrationResponse(
@@ -115,7 +152,7 @@ async def get_current_user_profile(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     _current_user: CurrentUserDep,
 ) -> UserResponse:
     result = await session.execute(select(UserModel).where(UserModel.id == user_id))
@@ -140,10 +177,26 @@ async def get_user(
 
 @router.get("/", response_model=list[UserResponse], include_in_schema=False)
 async def list_users(
-    session: SessionDep,
+    session: ReadSessionDep,
     _current_user: CurrentUserDep,
+    limit: int = Query(100, ge=1, le=500),
+    after_id: Optional[int] = Query(
+        None,
+        alias="afterId",
+        description="Return users with an id greater than this cursor",
+    ),
 ) -> list[UserResponse]:
-    result = await session.execute(select(UserModel))
+    # Batch the schools into one IN query instead of joining them onto every row.
+    query = (
+        select(UserModel)
+        .options(selectinload(UserModel.school))
+        .order_by(UserModel.id)
+        .limit(limit)
+    )
+    if after_id is not None:
+        query = query.where(UserModel.id > after_id)
+
+    result = await session.execute(query)
     users = result.scalars().all()
     return [
         UserResponse(
@@ -188,9 +241,10 @@ async def update_user(
     if payload.status is not None:
         db_user.status = payload.status
     if payload.password is not None:
-        db_user.password_hash = hash_password(payload.password)
+        db_user.password_hash = await run_in_threadpool(hash_password, payload.password)
 
     await session.commit()
+    invalidate_cached_user(user_id)
     await session.refresh(db_user)
 
     return UserResponse(
@@ -213,29 +267,45 @@ async def update_user_school(
     session: SessionDep,
     _current_user: CurrentUserDep,
 ) -> UserResponse:
-    result = await session.execute(select(UserModel).where(UserModel.id == user_id))
-    db_user = result.scalar_one_or_none()
-    if not db_user:
+    school = await _get_school_or_404(session, payload.schoolId)
+
+    # Single UPDATE ... RETURNING instead of fetch, mutate, commit and refresh.
+    result = await session.execute(
+        update(UserModel)
+        .where(UserModel.id == user_id)
+        .values(school_id=school.id)
+        .returning(
+            UserModel.id,
+            UserModel.email,
+            UserModel.first_name,
+            UserModel.last_name,
+            UserModel.status,
+            UserModel.account_type,
+            UserModel.photo,
+            UserModel.created_at,
+        )
+    )
+    row = result.one_or_none()
+    if row is None:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    db_user.school = await _get_school_or_404(session, payload.schoolId)
-
     await session.commit()
-    await session.refresh(db_user)
+    invalidate_cached_user(user_id)
 
     return UserResponse(
-        id=db_user.id,
-        email=db_user.email,
-        firstName=db_user.first_name,
-        lastName=db_user.last_name,
-        status=db_user.status,
-        accountType=db_user.account_type,
-        school=_serialize_school(db_user.school),
-        photo=db_user.photo,
-        created_at=db_user.created_at,
+        id=row.id,
+        email=row.email,
+        firstName=row.first_name,
+        lastName=row.last_name,
+        status=row.status,
+        accountType=row.account_type,
+        school=_serialize_school(school),
+        photo=row.photo,
+        created_at=row.created_at,
     )
 
 
@@ -246,6 +316,13 @@ async def change_user_password(
     session: SessionDep,
     current_user: CurrentUserDep,
 ) -> SuccessResponse:
+    # The permission check needs no database access, so reject early.
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not allowed to change another user's password",
+        )
+
     result = await session.execute(select(UserModel).where(UserModel.id == user_id))
     db_user = result.scalar_one_or_none()
     if not db_user:
@@ -254,20 +331,15 @@ async def change_user_password(
             detail="User not found",
         )
 
-    if current_user.id != db_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not allowed to change another user's password",
-        )
-
-    if not verify_password(payload.currentPassword, db_user.password_hash):
+    if not await run_in_threadpool(verify_password, payload.currentPassword, db_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
-    db_user.password_hash = hash_password(payload.newPassword)
+    db_user.password_hash = await run_in_threadpool(hash_password, payload.newPassword)
     await session.commit()
+    invalidate_cached_user(user_id)
 
     return SuccessResponse(message="Password updated successfully")
 
@@ -287,4 +359,7 @@ async def delete_user(
 
     await session.delete(db_user)
     await session.commit()
+    invalidate_cached_user(user_id)
+    # The user's owned groups and memberships go with the account.
+    invalidate_cached_group_lists()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
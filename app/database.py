@@ -7,6 +7,7 @@ import re
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -18,16 +19,21 @@ from sqlalchemy.pool import NullPool
 
 from app.config.settings import settings
 
-# Import models so they are attached to Base.metadata before table creation
-from app.models import Base  # noqa: F401 - ensures metadata is registered
-from app.models import hello  # noqa: F401
-from app.models import log  # noqa: F401
-from app.models import user  # noqa: F401
+# Importing the package registers every model on Base.metadata before table creation.
+from app.models import Base
 
 logger = logging.getLogger(__name__)
 
 _SCHEMA_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
+# Case-insensitive unique indexes as (index name, table, indexed expressions).
+_LOWER_UNIQUE_INDEXES = (
+    ("uq_groups_school_lower_name", "groups", "school_id, lower(name)"),
+    ("uq_schools_lower_name", "schools", "lower(name)"),
+    ("uq_schools_lower_value", "schools", "lower(value)"),
+    ("ix_users_email_lower", "users", "email_lower"),
+)
+
 
 def _normalise_schema_name(raw_schema: str | None) -> str | None:
     """Return a sanitised schema name or None when invalid/empty."""
@@ -65,20 +71,45 @@ if _SCHEMA_NAME:
             table.schema = _SCHEMA_NAME
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values (e.g. training context turns) with orjson."""
+
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 def _create_engine() -> AsyncEngine:
     """Create an async engine with environment-appropriate pooling."""
 
+    database = settings.database
     engine_options: dict[str, Any] = {
-        "echo": settings.debug,
+        "echo": settings.sql_echo,
         "future": True,
         "pool_pre_ping": True,
+        "json_serializer": _json_serializer,
+        "query_cache_size": database.query_cache_size,
     }
 
-    if settings.database.serverless or settings.debug:
+    server_settings: dict[str, str] = {}
+    if database.disable_jit:
+        server_settings["jit"] = "off"
+    if _SCHEMA_NAME:
+        # Applied once per physical connection instead of on every session checkout.
+        server_settings["search_path"] = f'"{_quote_identifier(_SCHEMA_NAME)}", public'
+    if server_settings:
+        engine_options["connect_args"] = {"server_settings": server_settings}
+
+    if database.serverless or settings.debug:
         # Disable pooling when working with serverless databases (or in debug).
         engine_options["poolclass"] = NullPool
+    else:
+        engine_options.update(
+            pool_size=database.pool_size,
+            max_overflow=database.max_overflow,
+            pool_timeout=database.pool_timeout,
+            pool_recycle=database.pool_recycle,
+        )
 
-    return create_async_engine(settings.database.url, **engine_options)
+    return create_async_engine(database.url, **engine_options)
 
 
 engine: AsyncEngine = _create_engine()
@@ -89,6 +120,14 @@ SessionFactory = async_sessionmaker(
     class_=AsyncSession,
 )
 
+# Read-only endpoints run in autocommit so point queries skip the BEGIN/COMMIT pair.
+ReadSessionFactory = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    expire_on_commit=False,
+    autoflush=False,
+    class_=AsyncSession,
+)
+
 
 async def _ensure_search_path(target: Any) -> None:
     """Set the search_path on the given session/connection when a schema is configured."""
@@ -157,13 +196,90 @@ async def _apply_backfill_migrations(conn: Any) -> None:
         )
     )
 
+    # Composite indexes backing the per-user and per-session score lookups.
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_phase_scores_user_phase_created "
+            "ON phase_scores (user_id, phase_id, created_at)"
+        )
+    )
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_phase_scores_session_user_created "
+            "ON phase_scores (training_session_id, user_id, created_at)"
+        )
+    )
+
+    # Lower-cased email kept by PostgreSQL for case-insensitive login lookups.
+    await conn.execute(
+        text(
+            "ALTER TABLE IF EXISTS users "
+            "ADD COLUMN IF NOT EXISTS email_lower VARCHAR(255) "
+            "GENERATED ALWAYS AS (lower(email)) STORED"
+        )
+    )
+    # Earlier releases built ix_users_email_lower as a plain index; drop it so the
+    # loop below rebuilds it as unique (the whole startup runs in one transaction).
+    await conn.execute(
+        text(
+            """
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_index
+                    WHERE indexrelid = to_regclass('ix_users_email_lower')
+                      AND NOT indisunique
+                ) THEN
+                    DROP INDEX ix_users_email_lower;
+                END IF;
+            END
+            $$;
+            """
+        )
+    )
+
+    # create_group and create_school detect duplicates only through these
+    # indexes (ON CONFLICT DO NOTHING) and login resolves emails through one, so
+    # startup fails while legacy rows still collide case-insensitively instead
+    # of running without them.
+    for index_name, table_name, expressions in _LOWER_UNIQUE_INDEXES:
+        await conn.execute(
+            text(
+                f"""
+                DO $$
+                BEGIN
+                    IF to_regclass('{table_name}') IS NULL THEN
+                        RETURN;
+                    END IF;
+                    IF EXISTS (
+                        SELECT 1 FROM {table_name}
+                        GROUP BY {expressions}
+                        HAVING count(*) > 1
+                    ) THEN
+                        RAISE EXCEPTION
+                            'Cannot create unique index {index_name}: {table_name} '
+                            'has rows that collide on ({expressions}); '
+                            'rename or merge them and restart.';
+                    END IF;
+                    CREATE UNIQUE INDEX IF NOT EXISTS {index_name}
+                    ON {table_name} ({expressions});
+                END
+                $$;
+                """
+            )
+        )
+
 
 @asynccontextmanager
 async def session_scope() -> AsyncIterator[AsyncSession]:
-    """Async context manager that yields a configured SQLAlchemy session."""
+    """Async context manager that yields a configured SQLAlchemy session.
+
+    The schema search_path is part of the connection startup settings, so the
+    session can be handed out without an extra ``SET`` round-trip. Callers must
+    not keep references to the session beyond the ``async with`` block.
+    """
 
     async with SessionFactory() as session:
-        await _ensure_search_path(session)
         yield session
 
 
@@ -174,6 +290,13 @@ async def get_session() -> AsyncIterator[AsyncSession]:
         yield session
 
 
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding an autocommit session for read-only endpoints."""
+
+    async with ReadSessionFactory() as session:
+        yield session
+
+
 async def init_models() -> None:
     """Create database tables if they do not exist."""
 
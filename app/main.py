@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
 import sys
 from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from .config.settings import settings
@@ -19,9 +20,43 @@ from .database import dispose_engine, init_models
 from .middleware import StructuredLoggingMiddleware, TelemetryMiddleware
 
 
+_LOG_LISTENERS: list[QueueListener] = []
+_LOG_QUEUE_MAX_RECORDS = 10_000
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of growing without bound."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # A stalled sink must not turn into unbounded memory growth or
+            # block the event loop; losing log lines is the lesser evil.
+            pass
+
+
+def _attach_queued_handlers(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """Route ``logger`` through a queue so file/stdout writes happen off the event loop."""
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=_LOG_QUEUE_MAX_RECORDS)
+    logger.addHandler(_BoundedQueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _LOG_LISTENERS.append(listener)
+
+
+def _stop_log_listeners() -> None:
+    """Flush and stop the background logging threads."""
+
+    while _LOG_LISTENERS:
+        _LOG_LISTENERS.pop().stop()
+
+
 def _configure_logging() -> None:
     """Ensure structured middleware logs stream to stdout and file."""
 
+    _stop_log_listeners()
     logging.getLogger().handlers.clear()
 
     stdout_handler = logging.StreamHandler(sys.stdout)
@@ -42,15 +77,14 @@ def _configure_logging() -> None:
     )
 
     root_logger = logging.getLogger()
-    root_logger.addHandler(stdout_handler)
-    root_logger.addHandler(file_handler)
+    _attach_queued_handlers(root_logger, stdout_handler, file_handler)
     root_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
 
     middleware_logger = logging.getLogger("app.middleware.structured")
     middleware_logger.handlers.clear()
     middleware_stdout = logging.StreamHandler(sys.stdout)
     middleware_stdout.setFormatter(logging.Formatter("%(message)s"))
-    middleware_logger.addHandler(middleware_stdout)
+    _attach_queued_handlers(middleware_logger, middleware_stdout)
     middleware_logger.setLevel(logging.INFO)
     middleware_logger.propagate = False
 
@@ -67,7 +101,7 @@ def _configure_logging() -> None:
     )
     pipeline_logger = logging.getLogger("app.services.audio_pipeline")
     pipeline_logger.handlers.clear()
-    pipeline_logger.addHandler(pipeline_handler)
+    _attach_queued_handlers(pipeline_logger, pipeline_handler)
     pipeline_logger.setLevel(logging.INFO)
 
     transcript_log_path = Path(getattr(settings, "transcript_log_file", "logs/transcripts.log"))
@@ -83,7 +117,7 @@ def _configure_logging() -> None:
     )
     transcript_logger = logging.getLogger("app.logs.transcript")
     transcript_logger.handlers.clear()
-    transcript_logger.addHandler(transcript_handler)
+    _attach_queued_handlers(transcript_logger, transcript_handler)
     transcript_logger.setLevel(logging.INFO)
 
     noisy_loggers = [
@@ -106,6 +140,7 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         debug=settings.debug,
         description="EcoWhiskey Air Traffic Control Backend API",
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(TelemetryMiddleware)
@@ -177,6 +212,8 @@ def create_app() -> FastAPI:
     @app.on_event("shutdown")
     async def shutdown_event() -> None:
         await dispose_engine()
+        await metar.close_metar_client()
+        _stop_log_listeners()
 
     return app
 
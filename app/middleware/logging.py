@@ -26,6 +26,8 @@ COLOR_CYAN = "\u001b[36m"
 COLOR_YELLOW = "\u001b[33m"
 COLOR_RED = "\u001b[31m"
 
+_USER_ID_KEYS = ("id", "user_id", "userId")
+
 
 @dataclass(slots=True)
 class SessionContext:
@@ -315,17 +317,16 @@ class StructuredLoggingMiddleware(BaseHTTPMiddleware):
             return None
 
         if isinstance(source, dict):
-            for key in ("id", "user_id", "userId"):
+            for key in _USER_ID_KEYS:
                 value = source.get(key)
                 if value is not None:
                     return value
             return None
 
-        for attr in ("id", "user_id", "userId"):
-            if hasattr(source, attr):
-                value = getattr(source, attr)
-                if value is not None:
-                    return value
+        for attr in _USER_ID_KEYS:
+            value = getattr(source, attr, None)
+            if value is not None:
+                return value
 
         if hasattr(source, "model_dump"):
             try:
@@ -4,7 +4,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -14,6 +24,8 @@ class Group(Base):
     """Represents an instructor-managed group scoped to an academy."""
 
     __tablename__ = "groups"
+    # Fetch the server-side timestamps via RETURNING at flush instead of a refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(120), nullable=False)
@@ -48,18 +60,31 @@ class Group(Base):
             "name",
             name="uq_groups_school_name",
         ),
+        # Case-insensitive uniqueness; create_group relies on it for ON CONFLICT.
+        Index(
+            "uq_groups_school_lower_name",
+            "school_id",
+            func.lower(name),
+            unique=True,
+        ),
     )
 
-    school = relationship("School", back_populates="groups")
+    # Relationships are never read implicitly; an accidental lazy load raises
+    # instead of emitting SQL from inside response serialization.
+    school = relationship("School", back_populates="groups", lazy="raise_on_sql")
     owner = relationship(
         "User",
         back_populates="owned_groups",
         foreign_keys=[owner_id],
+        lazy="raise_on_sql",
     )
+    # ON DELETE CASCADE removes memberships, so deletes need not load them.
     memberships = relationship(
         "GroupMembership",
         back_populates="group",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -36,6 +36,8 @@ class GroupMembership(Base):
     """Association table between users and groups."""
 
     __tablename__ = "group_memberships"
+    # Fetch the server-side timestamps via RETURNING at flush instead of a refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     group_id = Column(
@@ -84,9 +86,16 @@ class GroupMembership(Base):
         ),
     )
 
-    group = relationship("Group", back_populates="memberships")
-    user = relationship("User", back_populates="group_memberships", foreign_keys=[user_id])
-    invited_by = relationship("User", foreign_keys=[invited_by_id])
+    # Relationships are never read implicitly; an accidental lazy load raises
+    # instead of emitting SQL from inside response serialization.
+    group = relationship("Group", back_populates="memberships", lazy="raise_on_sql")
+    user = relationship(
+        "User",
+        back_populates="group_memberships",
+        foreign_keys=[user_id],
+        lazy="raise_on_sql",
+    )
+    invited_by = relationship("User", foreign_keys=[invited_by_id], lazy="raise_on_sql")
 
 
 __all__ = ["GroupMembership", "GroupRole", "GroupMembershipStatus"]
@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String, Float
+from sqlalchemy import Column, DateTime, ForeignKey, String, Float, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -52,3 +52,18 @@ class PhaseScore(Base):
 
     # relationships
     user = relationship("User", backref="phase_scores")
+
+    __table_args__ = (
+        Index(
+            "ix_phase_scores_user_phase_created",
+            "user_id",
+            "phase_id",
+            "created_at",
+        ),
+        Index(
+            "ix_phase_scores_session_user_created",
+            "training_session_id",
+            "user_id",
+            "created_at",
+        ),
+    )
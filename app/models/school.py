@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base
@@ -23,6 +23,12 @@ class School(Base):
         default=datetime.utcnow,
     )
 
+    # Case-insensitive uniqueness; create_school relies on it for ON CONFLICT.
+    __table_args__ = (
+        Index("uq_schools_lower_name", func.lower(name), unique=True),
+        Index("uq_schools_lower_value", func.lower(value), unique=True),
+    )
+
     users = relationship("User", back_populates="school")
     groups = relationship(
         "Group",
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Text
+from sqlalchemy import Column, Computed, DateTime, Text
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
@@ -33,6 +33,11 @@ class User(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
+    # Generated by PostgreSQL so lookups can match emails case-insensitively via an
+    # index; unique so login and password reset always resolve to a single account.
+    email_lower = Column(
+        String(255), Computed("lower(email)", persisted=True), unique=True, index=True
+    )
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
     password_hash = Column(String(256), nullable=False)
@@ -16,18 +16,21 @@ from .flow import AudioAnalysisPipeline, PipelineStage
 from .ingestion import normalize_frequency, read_audio_bytes, resolve_content_type
 from .intent import classify_intent
 from .llm import call_conversation_llm
-from .persistence import context_base
+from .persistence import context_base, context_base_header
 from .prompts import build_llm_request
 from .synthesis import synthesize_controller_audio
 from .transcription import transcribe_audio
-from .types import LlmOutcome, LlmRequest
+from .types import LlmOutcome, LlmRequest, SessionContext, SessionView
 
 __all__ = [
     "AudioAnalysisPipeline",
     "PipelineStage",
     "LlmOutcome",
     "LlmRequest",
+    "SessionContext",
+    "SessionView",
     "context_base",
+    "context_base_header",
     "fetch_session_context",
     "build_llm_request",
     "call_conversation_llm",
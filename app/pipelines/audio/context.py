@@ -7,7 +7,6 @@ It maps to **Stage 02** of the overall flow documented in ``flow.py``.
 
 from __future__ import annotations
 
-import copy
 import json
 import logging
 import random
@@ -17,6 +16,9 @@ from uuid import UUID
 
 from app.services.context_repository import get_context as get_session_context
 
+from .ingestion import normalize_frequency
+from .types import SessionContext
+
 logger = logging.getLogger("app.services.audio_pipeline")
 
 _RESOURCE_ROOT = Path(__file__).resolve().parents[2] / "resources"
@@ -146,6 +148,37 @@ def _apply_context_overrides(
             scenario[key] = value
 
 
+def _copy_scenario_for_overrides(scenario: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy only the parts of a scenario that :func:`_apply_context_overrides` mutates.
+
+    The top level, ``shared`` (and its ``student`` section), the ``phases`` list
+    and each phase with its ``data`` section get fresh containers; everything
+    else is shared with the cached template or stored context, which are
+    never mutated.
+    """
+
+    copied = dict(scenario)
+    shared = copied.get("shared")
+    if isinstance(shared, Mapping):
+        shared = dict(shared)
+        student = shared.get("student")
+        if isinstance(student, Mapping):
+            shared["student"] = dict(student)
+        copied["shared"] = shared
+    phases = copied.get("phases")
+    if isinstance(phases, list):
+        phase_copies: list[Any] = []
+        for phase in phases:
+            if isinstance(phase, Mapping):
+                phase = dict(phase)
+                data_section = phase.get("data")
+                if isinstance(data_section, Mapping):
+                    phase["data"] = dict(data_section)
+            phase_copies.append(phase)
+        copied["phases"] = phase_copies
+    return copied
+
+
 _AIRPORT_PROFILE = _load_resource_json("airports/mrpv.json")
 
 # TODO: ESTO ESTA QUEMADO ACA
@@ -238,7 +271,7 @@ def _ensure_session_randomization(stored_context: MutableMapping[str, Any]) -> N
     stored_context["meteo"] = meteo
 
 
-async def fetch_session_context(session_id: UUID) -> Mapping[str, Any]:
+async def fetch_session_context(session_id: UUID) -> SessionContext:
     """Pull any relevant context for the session from the database."""
 
     context_state = await get_session_context(session_id)
@@ -256,12 +289,12 @@ async def fetch_session_context(session_id: UUID) -> Mapping[str, Any]:
         or (stored_context.get("scenario") or {}).get("id")
         or _DEFAULT_SCENARIO_ID
     )
-    base_scenario = _SCENARIOS.get(scenario_id) or _SCENARIOS.get(_DEFAULT_SCENARIO_ID, {})
-    scenario = copy.deepcopy(base_scenario) if base_scenario else {}
-
     stored_scenario = stored_context.get("scenario")
     if isinstance(stored_scenario, Mapping):
-        scenario = copy.deepcopy(stored_scenario)
+        scenario = _copy_scenario_for_overrides(stored_scenario)
+    else:
+        base_scenario = _SCENARIOS.get(scenario_id) or _SCENARIOS.get(_DEFAULT_SCENARIO_ID, {})
+        scenario = _copy_scenario_for_overrides(base_scenario) if base_scenario else {}
 
     phases = scenario.get("phases") or []
     phase_map = {phase["id"]: phase for phase in phases if phase.get("id")}
@@ -300,6 +333,12 @@ async def fetch_session_context(session_id: UUID) -> Mapping[str, Any]:
             str(key): str(value) for key, value in scenario_frequencies.items()
         }
 
+    # Normalize each group's frequency once so the controller compares with a dict hit.
+    normalized_frequencies = {
+        str(key): normalize_frequency(value)
+        for key, value in scenario_frequencies.items()
+    }
+
     default_frequency_group = (
         stored_context.get("default_frequency_group")
         or scenario.get("default_frequency_group")
@@ -308,7 +347,9 @@ async def fetch_session_context(session_id: UUID) -> Mapping[str, Any]:
         default_frequency_group = current_phase.get("frequency")
 
     context_base = dict(stored_context)
-    context_base["scenario"] = copy.deepcopy(scenario)
+    context_base["scenario"] = {
+        key: value for key, value in scenario.items() if key != "_phase_map"
+    }
     context_base["scenario_id"] = scenario_id
     context_base["frequencies"] = scenario_frequencies
     if default_phase_id:
@@ -339,6 +380,7 @@ async def fetch_session_context(session_id: UUID) -> Mapping[str, Any]:
         or stored_context.get("squawk"),
         "squawk": stored_context.get("squawk"),
         "frequencies": scenario_frequencies,
+        "normalized_frequencies": normalized_frequencies,
         "turn_history": turns,
         "recent_turns": turns[-8:],
     }
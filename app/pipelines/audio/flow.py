@@ -24,7 +24,7 @@ from dataclasses import dataclass
 from typing import Iterable, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineStage:
     """Human-readable description of one stage in the audio pipeline."""
 
@@ -2,45 +2,89 @@
 
 from __future__ import annotations
 
-import mimetypes
+import os
+import re
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from typing import Final
 
 from fastapi import HTTPException, UploadFile, status
 
-_ALLOWED_CONTENT_TYPES: Final[set[str]] = {
-    "audio/mpeg",
-    "audio/mp3",
-    "audio/mp4",
-    "audio/x-m4a",
-    "audio/m4a",
+from app.config.settings import settings
+
+# Canonical "NNN.N" to "NNN.NNN" forms can be padded without going through Decimal.
+_FAST_FREQUENCY_PATTERN: Final = re.compile(r"[1-9]\d{2}\.\d{1,3}")
+
+_ALLOWED_CONTENT_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        "audio/mpeg",
+        "audio/mp3",
+        "audio/mp4",
+        "audio/x-m4a",
+        "audio/m4a",
+    }
+)
+
+# Resolve the supported extensions directly instead of consulting mimetypes.
+_EXTENSION_CONTENT_TYPES: Final[dict[str, str]] = {
+    ".mp3": "audio/mpeg",
+    ".mpga": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".mp4": "audio/mp4",
 }
 
 
+def _unsupported_audio() -> HTTPException:
+    """Build the 400 raised for uploads that are not MP3 or M4A."""
+
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Only MP3 or M4A audio files are supported",
+    )
+
+
 def resolve_content_type(audio_file: UploadFile) -> str:
     """Accept MP3/M4A uploads regardless of whether the client set a content-type."""
 
     content_type = audio_file.content_type
     if not content_type and audio_file.filename:
-        guessed_type, _ = mimetypes.guess_type(audio_file.filename)
-        content_type = guessed_type
+        extension = os.path.splitext(audio_file.filename)[1].lower()
+        content_type = _EXTENSION_CONTENT_TYPES.get(extension)
+        if content_type is None and extension:
+            raise _unsupported_audio()
 
     content_type = content_type or "audio/mpeg"
 
     if content_type not in _ALLOWED_CONTENT_TYPES:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only MP3 or M4A audio files are supported",
-        )
+        raise _unsupported_audio()
     return content_type
 
 
+def _upload_too_large() -> HTTPException:
+    """Build the 413 raised when an upload exceeds the configured limit."""
+
+    limit_mb = settings.max_audio_upload_bytes / (1024 * 1024)
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Uploaded audio file exceeds {limit_mb:g} MB",
+    )
+
+
 async def read_audio_bytes(audio_file: UploadFile) -> bytes:
-    """Load the upload fully into memory, rejecting empty payloads."""
+    """Load the upload into memory, rejecting empty or oversized payloads."""
 
-    audio_bytes = await audio_file.read()
+    limit = settings.max_audio_upload_bytes
+    declared_size = getattr(audio_file, "size", None)
+    if declared_size is not None and declared_size > limit:
+        # Reject from the spooled file's size without pulling it into memory.
+        await audio_file.close()
+        raise _upload_too_large()
+
+    audio_bytes = await audio_file.read(limit + 1)
     await audio_file.close()
 
+    if len(audio_bytes) > limit:
+        raise _upload_too_large()
     if not audio_bytes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -59,7 +103,18 @@ def normalize_frequency(value: str | None) -> str | None:
     if not cleaned:
         return None
 
+    return _normalize_frequency_text(cleaned)
+
+
+@lru_cache(maxsize=256)
+def _normalize_frequency_text(cleaned: str) -> str:
+    """Quantize a non-empty frequency string; cached since scenarios reuse a handful."""
+
     cleaned = cleaned.replace(",", ".")
+    if _FAST_FREQUENCY_PATTERN.fullmatch(cleaned):
+        whole, fraction = cleaned.split(".")
+        return f"{whole}.{fraction:0<3}"
+
     try:
         as_decimal = Decimal(cleaned)
     except (InvalidOperation, ValueError):
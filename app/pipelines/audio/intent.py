@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from typing import Any, Mapping
 
 from app.services.llm_client import BedrockLlmClient, LlmInvocationError
@@ -18,6 +19,11 @@ _SYSTEM_PROMPT = (
     "(ground, tower, approach o radar)."
 )
 
+# Students often repeat the same phrase (retries, scripted drills), so successful
+# classifications are remembered per (transcript, known frequencies) prompt.
+_CLASSIFICATION_CACHE_MAX_ENTRIES = 2048
+_classification_cache: OrderedDict[tuple[str, str], IntentClassificationResponse] = OrderedDict()
+
 
 async def classify_intent(
     transcript: str,
@@ -25,7 +31,8 @@ async def classify_intent(
 ) -> IntentClassificationResponse | None:
     """Use the conversational LLM to guess the student's intent + frequency group."""
 
-    if not transcript.strip():
+    cleaned_transcript = transcript.strip()
+    if not cleaned_transcript:
         return None
 
     frequency_map = session_context.get("frequencies")
@@ -34,9 +41,15 @@ async def classify_intent(
         hints = [f"- {key}: {value}" for key, value in frequency_map.items()]
         frequency_lines = "\nFrecuencias conocidas:\n" + "\n".join(hints)
 
+    cache_key = (cleaned_transcript, frequency_lines)
+    cached = _classification_cache.get(cache_key)
+    if cached is not None:
+        _classification_cache.move_to_end(cache_key)
+        return cached
+
     user_prompt = (
         "Transcripción del alumno:\n"
-        f"{transcript.strip()}\n\n"
+        f"{cleaned_transcript}\n\n"
         "Indica la intención en snake_case (por ejemplo: tower_takeoff_clearance, ground_taxi_clearance) "
         "y el grupo de frecuencia adecuado.\n"
         "Devuelve exclusivamente JSON con la forma "
@@ -57,10 +70,15 @@ async def classify_intent(
         return None
 
     try:
-        return IntentClassificationResponse.from_json(raw_response)
+        classification = IntentClassificationResponse.from_json(raw_response)
     except Exception as exc:  # pragma: no cover - validation issues
         logger.warning("Intent detector invalid JSON: %s raw=%s", exc, raw_response)
         return None
 
+    _classification_cache[cache_key] = classification
+    while len(_classification_cache) > _CLASSIFICATION_CACHE_MAX_ENTRIES:
+        _classification_cache.popitem(last=False)
+    return classification
+
 
 __all__ = ["classify_intent"]
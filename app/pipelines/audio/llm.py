@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 
 from pydantic import ValidationError
 
+from app.config.settings import settings
 from app.services.llm_client import BedrockLlmClient
 from app.services.response_contract import ResponseContractError, StructuredLlmResponse
 
@@ -16,6 +18,11 @@ logger = logging.getLogger("app.services.audio_pipeline")
 _LLM_CLIENT = BedrockLlmClient()
 _MAX_JSON_RETRIES = 2  # Re-intentos cuando el LLM devuelve JSON inválido.
 
+# With temperature 0 the model is deterministic for a given prompt pair, so an
+# exact repeat (same phase, context, turns and transcript) can reuse the answer.
+_RESPONSE_CACHE_MAX_ENTRIES = 4096
+_response_cache: OrderedDict[tuple[str, str], LlmOutcome] = OrderedDict()
+
 
 def _truncate(value: str, max_length: int = 500) -> str:
     if len(value) <= max_length:
@@ -26,6 +33,14 @@ def _truncate(value: str, max_length: int = 500) -> str:
 async def call_conversation_llm(request: LlmRequest) -> LlmOutcome:
     """Invoke the LLM, validate the response contract, and render the phrase."""
 
+    cache_key = (request.system_prompt, request.user_prompt)
+    cacheable = settings.bedrock.temperature == 0.0
+    if cacheable:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            _response_cache.move_to_end(cache_key)
+            return cached
+
     last_error: ValidationError | None = None
     for attempt in range(_MAX_JSON_RETRIES + 1):
         raw_response = await _LLM_CLIENT.invoke(
@@ -64,10 +79,15 @@ async def call_conversation_llm(request: LlmRequest) -> LlmOutcome:
                 structured.intent,
                 request.intent,
             )
-        return LlmOutcome(
+        outcome = LlmOutcome(
             response=structured,
             raw_response=raw_response,
         )
+        if cacheable:
+            _response_cache[cache_key] = outcome
+            while len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+                _response_cache.popitem(last=False)
+        return outcome
 
     # This point should be unreachable because the loop either returns or raises.
     raise ResponseContractError("No se pudo obtener una respuesta válida.") from last_error
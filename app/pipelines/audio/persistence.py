@@ -21,15 +21,30 @@ _CONTEXT_FIELDS = (
 )
 
 
-def context_base(ctx: Mapping[str, Any], history: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
-    """Build the payload persisted alongside each turn for audit/debug purposes."""
+def context_base_header(ctx: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the turn-independent part of :func:`context_base` so callers can reuse it."""
 
-    base = {k: ctx[k] for k in _CONTEXT_FIELDS if ctx.get(k) is not None}
+    base = {k: v for k in _CONTEXT_FIELDS if (v := ctx.get(k)) is not None}
     scenario = base.get("scenario")
     if isinstance(scenario, Mapping):
         base["scenario"] = {k: v for k, v in scenario.items() if k != "_phase_map"}
-    base["turns"] = [dict(t) for t in history]
     return base
 
 
-__all__ = ["context_base"]
+def context_base(
+    ctx: Mapping[str, Any],
+    history: Sequence[Mapping[str, Any]],
+    header: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the payload persisted alongside each turn for audit/debug purposes.
+
+    Turn dicts are shared with ``history`` rather than copied; callers treat
+    stored turns as read-only once they have been appended.
+    """
+
+    base = dict(header) if header is not None else context_base_header(ctx)
+    base["turns"] = list(history)
+    return base
+
+
+__all__ = ["context_base", "context_base_header"]
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import logging
+import time
+from collections import OrderedDict
 from uuid import UUID
 
 from fastapi import HTTPException, status
 
 from app.services import (
     RadioTtsError,
+    RadioTtsResult,
     StorageError,
     get_radio_tts_service,
     upload_readback_audio,
@@ -18,6 +21,36 @@ logger = logging.getLogger("app.services.audio_pipeline")
 
 _RADIO_TTS_SERVICE = get_radio_tts_service()
 
+# Controllers repeat the same phrases across sessions ("Torre Pavas, adelante"),
+# so the synthesised audio is reused for identical text instead of re-synthesised.
+# Each session still uploads its own copy, keeping its S3 prefix self-contained.
+_READBACK_CACHE_TTL_SECONDS = 3600.0
+_READBACK_CACHE_MAX_ENTRIES = 256
+_readback_cache: OrderedDict[str, tuple[float, RadioTtsResult]] = OrderedDict()
+
+
+def _get_cached_readback(text: str) -> RadioTtsResult | None:
+    """Return the synthesised readback for the text while it is fresh."""
+
+    entry = _readback_cache.get(text)
+    if entry is None:
+        return None
+    expires_at, readback = entry
+    if expires_at < time.monotonic():
+        _readback_cache.pop(text, None)
+        return None
+    _readback_cache.move_to_end(text)
+    return readback
+
+
+def _cache_readback(text: str, readback: RadioTtsResult) -> None:
+    """Remember a synthesised readback, evicting the least recently used phrase."""
+
+    _readback_cache[text] = (time.monotonic() + _READBACK_CACHE_TTL_SECONDS, readback)
+    _readback_cache.move_to_end(text)
+    while len(_readback_cache) > _READBACK_CACHE_MAX_ENTRIES:
+        _readback_cache.popitem(last=False)
+
 
 async def synthesize_controller_audio(
     session_id: UUID,
@@ -30,14 +63,17 @@ async def synthesize_controller_audio(
     if not allow_response or not text:
         return None
 
-    try:
-        readback = await _RADIO_TTS_SERVICE.synthesize_readback(text)
-    except RadioTtsError as exc:  # pragma: no cover - integration failure
-        logger.exception("Fallo en Radio TTS", exc_info=exc)
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=str(exc),
-        ) from exc
+    readback = _get_cached_readback(text)
+    if readback is None:
+        try:
+            readback = await _RADIO_TTS_SERVICE.synthesize_readback(text)
+        except RadioTtsError as exc:  # pragma: no cover - integration failure
+            logger.exception("Fallo en Radio TTS", exc_info=exc)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=str(exc),
+            ) from exc
+        _cache_readback(text, readback)
 
     try:
         _, audio_url = await upload_readback_audio(
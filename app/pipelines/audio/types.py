@@ -8,12 +8,50 @@ creating circular dependencies.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, Any
+from typing import Any, Mapping, Sequence, TypedDict
 
 from app.services.response_contract import StructuredLlmResponse
 
 
-@dataclass(frozen=True)
+class _SessionTurnState(TypedDict, total=False):
+    """Keys the controller adds to a session context while handling a turn."""
+
+    active_frequency_group: str | None
+    session_completed: bool
+
+
+class SessionContext(_SessionTurnState):
+    """Shape of the per-request session context built by ``fetch_session_context``.
+
+    The controller mutates it in place while handling a turn, which is when the
+    optional keys inherited from ``_SessionTurnState`` appear.
+    """
+
+    airport: str
+    session_id: str
+    scenario_id: str | None
+    scenario: dict[str, Any]
+    phase_id: str | None
+    phase: Mapping[str, Any] | None
+    phase_map: dict[str, Mapping[str, Any]]
+    default_runway: str | None
+    alternate_runway: str | None
+    frequency_map: dict[str, str]
+    default_frequency_group: str | None
+    context_base: dict[str, Any]
+    meteo: Any
+    route: Any
+    taxi_route: Any
+    objectives: Any
+    transponder: Any
+    squawk: Any
+    frequencies: Mapping[str, Any]
+    normalized_frequencies: dict[str, str | None]
+    turn_history: Sequence[Mapping[str, Any]]
+    recent_turns: Sequence[Mapping[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
 class LlmRequest:
     """Normalized payload handed to the conversational LLM client."""
 
@@ -26,9 +64,60 @@ class LlmRequest:
     user_prompt: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LlmOutcome:
     """Structured result produced by the LLM stage of the pipeline."""
 
     response: StructuredLlmResponse
     raw_response: str
+
+
+@dataclass(frozen=True, slots=True)
+class SessionView:
+    """Type-checked snapshot of the session context fields read by the controller."""
+
+    phase_id: str | None
+    phase: Mapping[str, Any] | None
+    phase_intent: str | None
+    phase_frequency_group: str | None
+    phase_transitions: Mapping[str, Any]
+    phase_map: Mapping[str, Mapping[str, Any]]
+    frequencies: Mapping[str, Any]
+    normalized_frequencies: Mapping[str, str | None]
+    active_frequency_group: str | None
+    default_frequency_group: str | None
+    meteo: Any
+    route: Any
+    session_completed: bool
+
+    @classmethod
+    def from_context(cls, ctx: Mapping[str, Any]) -> "SessionView":
+        """Run the ``isinstance`` gating once instead of at every access site."""
+
+        phase = ctx.get("phase")
+        if not isinstance(phase, Mapping):
+            phase = None
+        transitions = phase.get("transitions") if phase is not None else None
+        phase_map = ctx.get("phase_map")
+        frequencies = ctx.get("frequencies")
+        normalized_frequencies = ctx.get("normalized_frequencies")
+        stored_context = ctx.get("context_base")
+        return cls(
+            phase_id=ctx.get("phase_id"),
+            phase=phase,
+            phase_intent=phase.get("intent") if phase is not None else None,
+            phase_frequency_group=phase.get("frequency") if phase is not None else None,
+            phase_transitions=transitions if isinstance(transitions, Mapping) else {},
+            phase_map=phase_map if isinstance(phase_map, Mapping) else {},
+            frequencies=frequencies if isinstance(frequencies, Mapping) else {},
+            normalized_frequencies=(
+                normalized_frequencies if isinstance(normalized_frequencies, Mapping) else {}
+            ),
+            active_frequency_group=ctx.get("active_frequency_group"),
+            default_frequency_group=ctx.get("default_frequency_group"),
+            meteo=ctx.get("meteo"),
+            route=ctx.get("route"),
+            session_completed=bool(
+                isinstance(stored_context, Mapping) and stored_context.get("session_completed")
+            ),
+        )
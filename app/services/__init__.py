@@ -1,19 +1,43 @@
-"""Service layer helpers for external integrations."""
-
-from .radio_tts import (
-    RadioTtsError,
-    RadioTtsResult,
-    RadioTtsService,
-    get_radio_tts_service,
-)
-from .email import EmailServiceError, send_email
-from .storage import StorageError, upload_readback_audio
-from .transcribe import (
-    TranscribeService,
-    TranscriptionError,
-    TranscriptionResult,
-    get_transcribe_service,
-)
+"""Service layer helpers for external integrations.
+
+Exports are resolved lazily so importing a lightweight submodule (for example
+``app.services.session_memory``) does not load boto3, numpy/scipy or the
+Transcribe streaming client.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .email import EmailServiceError, send_email
+    from .radio_tts import (
+        RadioTtsError,
+        RadioTtsResult,
+        RadioTtsService,
+        get_radio_tts_service,
+    )
+    from .storage import StorageError, upload_readback_audio
+    from .transcribe import (
+        TranscribeService,
+        TranscriptionError,
+        TranscriptionResult,
+        get_transcribe_service,
+    )
+
+_LAZY_EXPORTS = {
+    "RadioTtsService": ".radio_tts",
+    "RadioTtsResult": ".radio_tts",
+    "RadioTtsError": ".radio_tts",
+    "get_radio_tts_service": ".radio_tts",
+    "TranscribeService": ".transcribe",
+    "TranscriptionError": ".transcribe",
+    "TranscriptionResult": ".transcribe",
+    "get_transcribe_service": ".transcribe",
+    "StorageError": ".storage",
+    "upload_readback_audio": ".storage",
+    "EmailServiceError": ".email",
+    "send_email": ".email",
+}
 
 __all__ = [
     "RadioTtsService",
@@ -29,3 +53,15 @@ __all__ = [
     "EmailServiceError",
     "send_email",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule backing ``name`` on first access."""
+
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
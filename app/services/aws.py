@@ -5,9 +5,15 @@ from __future__ import annotations
 from typing import Any
 
 import boto3
+from botocore.config import Config
 
 from app.config.settings import settings
 
+# Each client is a process-wide singleton shared by the threadpool workers that
+# call it, so size the urllib3 pool past botocore's default of 10 connections
+# and keep idle connections alive between requests.
+_CLIENT_CONFIG = Config(max_pool_connections=50, tcp_keepalive=True)
+
 
 def create_boto3_client(
     service_name: str,
@@ -19,7 +25,7 @@ def create_boto3_client(
     """Instantiate a boto3 client using configured credentials if available."""
 
     region = region_name or settings.s3.region
-    client_kwargs: dict[str, Any] = {"region_name": region}
+    client_kwargs: dict[str, Any] = {"region_name": region, "config": _CLIENT_CONFIG}
     if aws_access_key_id and aws_secret_access_key:
         client_kwargs["aws_access_key_id"] = aws_access_key_id
         client_kwargs["aws_secret_access_key"] = aws_secret_access_key
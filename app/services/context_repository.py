@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import time
+import weakref
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Any, Mapping, MutableMapping
+from typing import Any, Mapping, MutableMapping, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
@@ -22,10 +27,87 @@ logger = logging.getLogger(__name__)
 
 MAX_TURNS_STORED = 40
 
+_CONTEXT_CACHE_TTL_SECONDS = 300.0
+_CONTEXT_CACHE_MAX_ENTRIES = 4096
+_context_cache: OrderedDict[UUID, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def _get_cached_context(session_id: UUID) -> dict[str, Any] | None:
+    """Return the last persisted context for the session while it is fresh."""
+
+    entry = _context_cache.get(session_id)
+    if entry is None:
+        return None
+    expires_at, stored = entry
+    if expires_at < time.monotonic():
+        _context_cache.pop(session_id, None)
+        return None
+    _context_cache.move_to_end(session_id)
+    return stored
+
+
+def _cache_context(session_id: UUID, stored: dict[str, Any]) -> None:
+    """Remember the persisted context, evicting the least recently used session."""
+
+    _context_cache[session_id] = (
+        time.monotonic() + _CONTEXT_CACHE_TTL_SECONDS,
+        stored,
+    )
+    _context_cache.move_to_end(session_id)
+    while len(_context_cache) > _CONTEXT_CACHE_MAX_ENTRIES:
+        _context_cache.popitem(last=False)
+
+
+# append_turn is a read-modify-write of the whole context row, so writes for the
+# same session are serialized; locks disappear once no coroutine holds them.
+_session_locks: weakref.WeakValueDictionary[UUID, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
+def _session_lock(session_id: UUID) -> asyncio.Lock:
+    """Return the lock guarding turn writes for the session."""
+
+    lock = _session_locks.get(session_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _session_locks[session_id] = lock
+    return lock
+
+
+# Turns are append-only and scenarios are copied before any override is applied,
+# so both are shared with the stored context; every other value is deep-copied.
+_SHARED_CONTEXT_KEYS = frozenset({"turns", "scenario"})
+
+
+def _copy_stored_context(stored: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a copy of the stored context that callers may mutate freely."""
+
+    context_copy = {
+        key: value if key in _SHARED_CONTEXT_KEYS else copy.deepcopy(value)
+        for key, value in stored.items()
+    }
+    context_copy["turns"] = list(stored.get("turns", []))
+    return context_copy
+
+
+def _turn_marks(turns: Sequence[Any]) -> list[Any]:
+    """Return the turn timestamps, which identify a turn list across JSON round trips."""
+
+    return [turn.get("timestamp") for turn in turns if isinstance(turn, Mapping)]
+
+
+def invalidate_cached_context(session_id: UUID) -> None:
+    """Forget a cached context so the next read goes back to the database."""
+
+    _context_cache.pop(session_id, None)
+
 
 async def get_context(session_id: UUID) -> MutableMapping[str, Any]:
     """Return the stored context for the training session (mutable copy)."""
 
+    cached = _get_cached_context(session_id)
+    if cached is not None:
+        return _copy_stored_context(cached)
+
     async with SessionFactory() as session:
         result = await session.execute(
             select(TrainingContext).where(
@@ -50,40 +132,46 @@ async def get_context(session_id: UUID) -> MutableMapping[str, Any]:
                 "turns": memory_get_turns(session_id),
             }
 
-        # Return a shallow copy so callers can mutate safely.
-        context_copy: MutableMapping[str, Any] = dict(stored)
-        turns = list(context_copy.get("turns", []))
+        # The stored dict may be cached, so callers get a copy they can mutate.
+        context_copy = _copy_stored_context(stored)
+        turns = context_copy["turns"]
         if turns:
             memory_set_turns(session_id, turns)
+            _cache_context(session_id, stored)
         else:
             turns = memory_get_turns(session_id)
         context_copy["turns"] = turns
         return context_copy
 
 
-async def append_turn(
+async def append_turns(
     session_id: UUID,
-    turn: Mapping[str, Any],
+    turns: Sequence[Mapping[str, Any]],
     *,
     user_id: int | None = None,
     base_context: Mapping[str, Any] | None = None,
 ) -> None:
-    """Append a turn to the training session context."""
+    """Append several turns to the training session context in a single write."""
 
-    enriched_turn = dict(turn)
-    enriched_turn.setdefault(
-        "timestamp",
-        datetime.utcnow().isoformat(timespec="seconds") + "Z",
-    )
+    if not turns:
+        return
 
-    async with SessionFactory() as session:
+    timestamp = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    enriched_turns = []
+    for turn in turns:
+        enriched_turn = dict(turn)
+        enriched_turn.setdefault("timestamp", timestamp)
+        enriched_turns.append(enriched_turn)
+
+    async with _session_lock(session_id), SessionFactory() as session:
         result = await session.execute(
             select(TrainingContext).where(
                 TrainingContext.training_session_id == session_id
             )
         )
         training_context = result.scalar_one_or_none()
-        memory_append_turn(session_id, enriched_turn)
+        for enriched_turn in enriched_turns:
+            memory_append_turn(session_id, enriched_turn)
 
         if not training_context:
             if user_id is None:
@@ -95,14 +183,11 @@ async def append_turn(
             context_data: dict[str, Any] = {}
             if base_context:
                 context_data.update({k: v for k, v in base_context.items() if k != "turns"})
-            base_turns = []
+            base_turns: deque[Any] = deque(maxlen=MAX_TURNS_STORED)
             if base_context and isinstance(base_context.get("turns"), list):
-                base_turns = [
-                    dict(item) if isinstance(item, Mapping) else item
-                    for item in base_context["turns"]
-                ]
-            base_turns.append(enriched_turn)
-            context_data["turns"] = base_turns[-MAX_TURNS_STORED:]
+                base_turns.extend(base_context["turns"])
+            base_turns.extend(enriched_turns)
+            context_data["turns"] = list(base_turns)
             training_context = TrainingContext(
                 training_session_id=session_id,
                 user_id=user_id,
@@ -114,24 +199,58 @@ async def append_turn(
             if not isinstance(raw_context, dict):
                 raw_context = {}
             context_data: dict[str, Any] = dict(raw_context)
-            base_turns = None
-            if base_context:
-                base_copy = dict(base_context)
-                base_turns = base_copy.pop("turns", None)
-                if base_copy:
-                    context_data.update(base_copy)
-            if isinstance(base_turns, list):
-                turns = [
-                    dict(item) if isinstance(item, Mapping) else item
-                    for item in base_turns
-                ]
+            base_copy = dict(base_context) if base_context else {}
+            base_turns = base_copy.pop("turns", None)
+            # The row just read under the session lock is authoritative for turns;
+            # the caller's copy may come from a stale cache in another worker.
+            row_turns = context_data.get("turns")
+            stale = (
+                bool(row_turns)
+                and isinstance(base_turns, list)
+                and _turn_marks(base_turns) != _turn_marks(row_turns)
+            )
+            if stale:
+                # Another writer appended since the caller read the context, so its
+                # phase state must not roll the row back; only new keys are taken.
+                logger.warning(
+                    "Contexto desactualizado; se conserva el estado guardado session_id=%s",
+                    session_id,
+                )
+                for key, value in base_copy.items():
+                    context_data.setdefault(key, value)
             else:
-                turns = list(context_data.get("turns", []))
-            turns.append(enriched_turn)
-            context_data["turns"] = turns[-MAX_TURNS_STORED:]
+                context_data.update(base_copy)
+            if not row_turns and isinstance(base_turns, list):
+                row_turns = base_turns
+            # The bounded deque drops the oldest turns as new ones arrive, so the
+            # stored list is built once instead of copied and then re-sliced.
+            stored_turns = deque(row_turns or [], maxlen=MAX_TURNS_STORED)
+            stored_turns.extend(enriched_turns)
+            context_data["turns"] = list(stored_turns)
             training_context.context = context_data
 
         await session.commit()
+        _cache_context(session_id, context_data)
+
+
+async def append_turn(
+    session_id: UUID,
+    turn: Mapping[str, Any],
+    *,
+    user_id: int | None = None,
+    base_context: Mapping[str, Any] | None = None,
+) -> None:
+    """Append a turn to the training session context."""
+
+    await append_turns(
+        session_id, [turn], user_id=user_id, base_context=base_context
+    )
 
 
-__all__ = ["get_context", "append_turn", "MAX_TURNS_STORED"]
+__all__ = [
+    "get_context",
+    "append_turn",
+    "append_turns",
+    "invalidate_cached_context",
+    "MAX_TURNS_STORED",
+]
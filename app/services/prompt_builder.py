@@ -8,7 +8,9 @@ Given a scenario phase, recent turns, and the student transcript, we emit:
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
+from itertools import islice
 from typing import Mapping, Sequence
 
 # Default personas for each tower/ground/etc. controller group.
@@ -32,7 +34,7 @@ PROMPT_TEMPLATES = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptContext:
     frequency_group: str
     airport: str
@@ -43,7 +45,7 @@ class PromptContext:
     difficulty: int = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptBundle:
     system_prompt: str
     user_prompt: str
@@ -55,7 +57,8 @@ def _format_turn_history(turn_history: Sequence[Mapping[str, object]] | None) ->
         return ""
 
     formatted_turns: list[str] = []
-    recent_slice = list(turn_history)[-6:]
+    # islice walks only the tail, so deque histories are not copied wholesale.
+    recent_slice = islice(turn_history, max(len(turn_history) - 6, 0), None)
     for idx, turn in enumerate(recent_slice):
         if not isinstance(turn, Mapping):
             formatted_turns.append(f"  {idx + 1}. {turn}")
@@ -81,11 +84,12 @@ def _format_turn_history(turn_history: Sequence[Mapping[str, object]] | None) ->
     return "Turnos previos:\n" + "\n".join(formatted_turns) + "\n\n"
 
 
-import re
+_DATA_PLACEHOLDER = re.compile(r"\[data\.([\w_]+)\]")
+
 
 def _substitute_dynamic_values(text: str, data: Mapping[str, object]) -> str:
     """Replace [data.key] placeholders with values from the data dictionary."""
-    if not text or not isinstance(text, str):
+    if not text or not isinstance(text, str) or "[data." not in text:
         return text
     
     def replacer(match):
@@ -96,7 +100,7 @@ def _substitute_dynamic_values(text: str, data: Mapping[str, object]) -> str:
             return str(val)
         return match.group(0)  # Keep original if key not found
 
-    return re.sub(r"\[data\.([\w_]+)\]", replacer, text)
+    return _DATA_PLACEHOLDER.sub(replacer, text)
 
 
 def build_prompt(
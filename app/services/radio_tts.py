@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
+import re
 from dataclasses import dataclass
 from html import escape as html_escape
 from typing import Any
@@ -19,7 +21,7 @@ from app.services.aws import create_boto3_client
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RadioTtsResult:
     """Synthesised audio bytes representing the radio-filtered speech."""
 
@@ -35,6 +37,28 @@ class RadioTtsError(RuntimeError):
 
 _polly_client = create_boto3_client("polly", region_name=settings.polly.region)
 
+# Long readbacks are split on sentence boundaries and synthesised concurrently.
+_MAX_CHUNK_CHARS = 200
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_for_synthesis(text: str) -> list[str]:
+    """Group whole sentences into chunks of at most ``_MAX_CHUNK_CHARS`` characters."""
+
+    if len(text) <= _MAX_CHUNK_CHARS:
+        return [text]
+    chunks: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_BREAK.split(text):
+        if current and len(current) + 1 + len(sentence) > _MAX_CHUNK_CHARS:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class RadioTtsService:
     """Generate readback audio with a radio effect using Amazon Polly."""
@@ -63,10 +87,19 @@ class RadioTtsService:
         """Convert text to speech, apply radio FX, and return WAV bytes."""
 
         voice = voice_id or self._default_voice_id
-        ssml = self._build_ssml(text, rate=rate, pitch=pitch)
-        pcm = await self._synthesize_pcm(ssml, voice)
-        processed = await run_in_threadpool(self._apply_radio_fx, pcm)
-        wav_bytes = await run_in_threadpool(self._to_wav_bytes, processed)
+        chunks = _split_for_synthesis(text)
+        if len(chunks) == 1:
+            pcm = await self._synthesize_pcm(self._build_ssml(text, rate=rate, pitch=pitch), voice)
+        else:
+            # Polly returns raw PCM, so the chunks join seamlessly before the radio FX pass.
+            parts = await asyncio.gather(
+                *(
+                    self._synthesize_pcm(self._build_ssml(chunk, rate=rate, pitch=pitch), voice)
+                    for chunk in chunks
+                )
+            )
+            pcm = np.concatenate(parts)
+        wav_bytes = await run_in_threadpool(self._render_wav, pcm)
         return RadioTtsResult(
             audio_bytes=wav_bytes,
             media_type="audio/wav",
@@ -89,29 +122,39 @@ class RadioTtsService:
 
     async def _synthesize_pcm(self, ssml: str, voice_id: str) -> np.ndarray:
         try:
-            response: dict[str, Any] = await run_in_threadpool(
-                _polly_client.synthesize_speech,
-                TextType="ssml",
-                Text=ssml,
-                VoiceId=voice_id,
-                Engine="neural",
-                OutputFormat="pcm",
-                SampleRate=str(self._sample_rate),
-            )
+            # The AudioStream body is read over the network, so it is drained in the
+            # same worker thread as the request instead of on the event loop.
+            pcm_bytes = await run_in_threadpool(self._fetch_pcm_bytes, ssml, voice_id)
         except (BotoCoreError, ClientError) as exc:
             logger.exception("Polly synth failed for voice '%s'", voice_id)
             raise RadioTtsError(f"Failed to synthesize speech: {exc}") from exc
 
-        audio_stream = response.get("AudioStream")
-        if audio_stream is None:
-            raise RadioTtsError("Polly returned no audio stream.")
-        pcm_bytes = audio_stream.read()
         if not pcm_bytes:
             raise RadioTtsError("Polly returned an empty audio stream.")
 
         audio = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32) / 32768.0
         return audio
 
+    def _fetch_pcm_bytes(self, ssml: str, voice_id: str) -> bytes:
+        response: dict[str, Any] = _polly_client.synthesize_speech(
+            TextType="ssml",
+            Text=ssml,
+            VoiceId=voice_id,
+            Engine="neural",
+            OutputFormat="pcm",
+            SampleRate=str(self._sample_rate),
+        )
+        audio_stream = response.get("AudioStream")
+        if audio_stream is None:
+            raise RadioTtsError("Polly returned no audio stream.")
+        try:
+            return audio_stream.read()
+        finally:
+            audio_stream.close()
+
+    def _render_wav(self, audio: np.ndarray) -> bytes:
+        return self._to_wav_bytes(self._apply_radio_fx(audio))
+
     def _apply_radio_fx(self, audio: np.ndarray) -> np.ndarray:
         filtered = self._bandpass(audio)
         compressed = self._soft_compress(filtered)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import io
 from typing import Tuple
 from uuid import UUID, uuid4
 
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi.concurrency import run_in_threadpool
 
@@ -17,6 +20,26 @@ class StorageError(RuntimeError):
 
 
 _s3_client = create_boto3_client("s3", region_name=settings.s3.region)
+# Uploads past the threshold (large student recordings) go out as concurrent
+# multipart parts; readback WAVs stay well below it and use a single PUT.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=4,
+)
+_UPLOAD_ERRORS = (BotoCoreError, ClientError, S3UploadFailedError)
+
+
+def _upload_bytes(bucket: str, key: str, data: bytes, content_type: str) -> None:
+    """Stream ``data`` to S3 from an in-memory view without copying it."""
+
+    _s3_client.upload_fileobj(
+        io.BytesIO(data),
+        bucket,
+        key,
+        ExtraArgs={"ContentType": content_type},
+        Config=_TRANSFER_CONFIG,
+    )
 
 
 def _object_url(bucket: str, key: str) -> str:
@@ -43,14 +66,8 @@ async def upload_readback_audio(
 
     object_key = f"sessions/{session_id}/readback-{uuid4().hex}.{extension.lstrip('.')}"
     try:
-        await run_in_threadpool(
-            _s3_client.put_object,
-            Bucket=bucket,
-            Key=object_key,
-            Body=audio_bytes,
-            ContentType=content_type,
-        )
-    except (BotoCoreError, ClientError) as exc:
+        await run_in_threadpool(_upload_bytes, bucket, object_key, audio_bytes, content_type)
+    except _UPLOAD_ERRORS as exc:
         raise StorageError(f"Failed to upload readback audio: {exc}") from exc
 
     return object_key, _object_url(bucket, object_key)
@@ -75,14 +92,8 @@ async def upload_session_asset(
 
     object_key = f"sessions/{session_id}/{kind}-{uuid4().hex}.{extension.lstrip('.')}"
     try:
-        await run_in_threadpool(
-            _s3_client.put_object,
-            Bucket=bucket,
-            Key=object_key,
-            Body=data,
-            ContentType=content_type,
-        )
-    except (BotoCoreError, ClientError) as exc:
+        await run_in_threadpool(_upload_bytes, bucket, object_key, data, content_type)
+    except _UPLOAD_ERRORS as exc:
         # Log but don't fail the request if storage fails
         # (or maybe we should? The user wants to keep files)
         # For now, let's re-raise as StorageError so the caller decides
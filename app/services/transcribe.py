@@ -6,6 +6,7 @@ import os
 import asyncio
 import logging
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -18,8 +19,13 @@ from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Containers ffmpeg can decode from a non-seekable pipe without a temp file.
+_STREAMABLE_CONTENT_TYPES = frozenset({"audio/mpeg", "audio/mp3"})
+# Only the tail of ffmpeg's stderr is kept for error messages.
+_STDERR_TAIL_BYTES = 8192
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TranscriptionResult:
     """Structured transcription outcome returned to controllers."""
 
@@ -40,11 +46,18 @@ class TranscribeService:
         language_code: str = "es-US",
         media_sample_rate_hz: int = 44100,
         media_encoding: str = "pcm",
+        max_concurrent_streams: int = 8,
+        stream_timeout_seconds: float = 120.0,
     ) -> None:
         self._region = region
         self._language_code = language_code
         self._media_sample_rate_hz = media_sample_rate_hz
         self._media_encoding = media_encoding
+        # Bound in-flight streams so bursts queue here instead of tripping the
+        # Transcribe concurrency quota or forking an ffmpeg per request.
+        self._stream_slots = asyncio.Semaphore(max_concurrent_streams)
+        # A stuck conversion or stream is abandoned so it cannot hold a slot forever.
+        self._stream_timeout_seconds = stream_timeout_seconds
         
         # Ensure credentials are available to the SDK
         if settings.s3.access_key:
@@ -65,12 +78,86 @@ class TranscribeService:
         if not audio_bytes:
             raise TranscriptionError("The uploaded audio file is empty.")
 
-        # Convert to PCM via ffmpeg
+        async with self._stream_slots:
+            try:
+                return await asyncio.wait_for(
+                    self._transcribe_pcm_stream(audio_bytes, content_type),
+                    timeout=self._stream_timeout_seconds,
+                )
+            except asyncio.TimeoutError as exc:
+                raise TranscriptionError(
+                    "Audio transcription timed out after "
+                    f"{self._stream_timeout_seconds:g} seconds."
+                ) from exc
+
+    async def _transcribe_pcm_stream(
+        self,
+        audio_bytes: bytes,
+        content_type: str,
+    ) -> TranscriptionResult:
+        """Decode the upload with ffmpeg and forward PCM to Transcribe as it is produced."""
+
+        # MP3 is a streamable format, so it is piped straight into ffmpeg's stdin.
+        if content_type in _STREAMABLE_CONTENT_TYPES:
+            return await self._run_ffmpeg("pipe:0", stdin_bytes=audio_bytes)
+
+        # ffmpeg needs a seekable input for M4A, so the upload still lands on disk,
+        # but its PCM output is streamed instead of being buffered in full first.
+        tmp_path = await run_in_threadpool(_write_temp_audio, audio_bytes)
         try:
-            pcm_data = await self._convert_to_pcm(audio_bytes)
-        except Exception as exc:
+            return await self._run_ffmpeg(tmp_path)
+        finally:
+            await run_in_threadpool(_remove_temp_audio, tmp_path)
+
+    async def _run_ffmpeg(
+        self,
+        source: str,
+        *,
+        stdin_bytes: bytes | None = None,
+    ) -> TranscriptionResult:
+        """Spawn ffmpeg on ``source`` and stream its PCM output to Transcribe."""
+
+        stdin_args = ("-nostdin",) if stdin_bytes is None else ()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg",
+                *stdin_args,
+                "-loglevel", "error",
+                "-i", source,
+                "-f", "s16le",
+                "-ac", "1",
+                "-ar", str(self._media_sample_rate_hz),
+                "pipe:1",
+                stdin=subprocess.PIPE if stdin_bytes is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except OSError as exc:
             raise TranscriptionError(f"Audio conversion failed: {exc}") from exc
 
+        # stdin is fed and stderr drained concurrently with reading stdout so no
+        # pipe can fill up and stall ffmpeg.
+        feeder = None
+        if stdin_bytes is not None:
+            feeder = asyncio.create_task(_feed_process_stdin(process, stdin_bytes))
+        stderr_reader = asyncio.create_task(_drain_process_stderr(process))
+        try:
+            return await self._stream_process_output(process, stderr_reader)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if feeder is not None:
+                await feeder
+            await stderr_reader
+
+    async def _stream_process_output(
+        self,
+        process: asyncio.subprocess.Process,
+        stderr_reader: asyncio.Task[bytes],
+    ) -> TranscriptionResult:
+        """Pipe ffmpeg's stdout into a Transcribe stream and collect the transcript."""
+
         stream = await self._client.start_stream_transcription(
             language_code=self._language_code,
             media_sample_rate_hz=self._media_sample_rate_hz,
@@ -78,29 +165,42 @@ class TranscribeService:
         )
 
         handler = _SimpleTranscriptHandler(stream.output_stream)
-            # Chunk size: 4KB (approx 23ms at 44.1kHz 16-bit mono)
-            # 44100 Hz * 2 bytes/sample = 88200 bytes/sec
-            # 8192 bytes / 88200 bytes/sec ~= 0.092 seconds (92ms)
+
         async def write_chunks():
             # Chunk size: 8KB (approx 92ms at 44.1kHz 16-bit mono)
             chunk_size = 8192
-            
-            logger.info(f"Starting stream. Total bytes: {len(pcm_data)}. Chunk size: {chunk_size}. No throttling.")
-            
             total_sent = 0
-            for i in range(0, len(pcm_data), chunk_size):
-                chunk = pcm_data[i : i + chunk_size]
-                await stream.input_stream.send_audio_event(audio_chunk=chunk)
-                total_sent += len(chunk)
-                
-                if i % (chunk_size * 50) == 0: # Log every ~50 chunks
-                     logger.debug(f"Streamed {total_sent}/{len(pcm_data)} bytes")
+            try:
+                while True:
+                    try:
+                        chunk = await process.stdout.readexactly(chunk_size)
+                    except asyncio.IncompleteReadError as exc:
+                        chunk = exc.partial
+                    if not chunk:
+                        break
+                    await stream.input_stream.send_audio_event(audio_chunk=chunk)
+                    total_sent += len(chunk)
+                    if len(chunk) < chunk_size:
+                        break
 
-            logger.info("Finished streaming audio bytes. Ending stream.")
-            await stream.input_stream.end_stream()
+                if await process.wait() != 0:
+                    stderr = await stderr_reader
+                    error_msg = stderr.decode("utf-8", errors="replace") or "No stderr"
+                    logger.error("ffmpeg failed. stderr: %s", error_msg)
+                    raise TranscriptionError(
+                        f"ffmpeg failed to convert audio to PCM: {error_msg}"
+                    )
+                if not total_sent:
+                    logger.warning("ffmpeg produced empty output.")
+            finally:
+                # Always close the stream so the result handler stops waiting.
+                logger.info(f"Finished streaming {total_sent} PCM bytes. Ending stream.")
+                await stream.input_stream.end_stream()
 
         try:
             await asyncio.gather(write_chunks(), handler.handle_events())
+        except TranscriptionError:
+            raise
         except Exception as exc:
             logger.error(f"Streaming loop failed: {exc}")
             raise TranscriptionError(f"Streaming transcription failed: {exc}") from exc
@@ -108,43 +208,43 @@ class TranscribeService:
         logger.info(f"Transcription complete. Length: {len(handler.transcript)}")
         return TranscriptionResult(transcript=handler.transcript.strip())
 
-    async def _convert_to_pcm(self, audio_bytes: bytes) -> bytes:
-        """Convert input audio to raw PCM s16le via ffmpeg using a thread."""
-        return await run_in_threadpool(self._convert_to_pcm_sync, audio_bytes)
 
-    def _convert_to_pcm_sync(self, audio_bytes: bytes) -> bytes:
-        """Synchronous ffmpeg conversion using a temporary file to support seeking."""
-        import tempfile
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
+async def _feed_process_stdin(process: asyncio.subprocess.Process, data: bytes) -> None:
+    """Write ``data`` to the process stdin and close it to signal end of input."""
+
+    try:
+        process.stdin.write(data)
+        await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # ffmpeg exited early; its exit status and stderr explain why.
+        pass
+    finally:
+        process.stdin.close()
+
+
+async def _drain_process_stderr(process: asyncio.subprocess.Process) -> bytes:
+    """Read stderr until EOF and return its last ``_STDERR_TAIL_BYTES`` bytes."""
+
+    tail = b""
+    while chunk := await process.stderr.read(_STDERR_TAIL_BYTES):
+        tail = (tail + chunk)[-_STDERR_TAIL_BYTES:]
+    return tail
+
+
+def _write_temp_audio(audio_bytes: bytes) -> str:
+    """Persist the upload to a temporary file so ffmpeg can seek within it."""
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".tmp") as tmp_file:
+        tmp_file.write(audio_bytes)
+        return tmp_file.name
+
+
+def _remove_temp_audio(tmp_path: str) -> None:
+    """Delete a temporary upload written by :func:`_write_temp_audio`."""
+
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
 
-        try:
-            process = subprocess.run(
-                [
-                    "ffmpeg",
-                    "-y", # Overwrite output if exists (though we use pipe)
-                    "-i", tmp_path,
-                    "-f", "s16le",
-                    "-ac", "1",
-                    "-ar", str(self._media_sample_rate_hz),
-                    "pipe:1",
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-            )
-            if not process.stdout:
-                logger.warning("ffmpeg produced empty output. stderr: %s", process.stderr.decode("utf-8", errors="replace"))
-            return process.stdout
-        except subprocess.CalledProcessError as exc:
-            error_msg = exc.stderr.decode("utf-8", errors="replace") if exc.stderr else "No stderr"
-            logger.error("ffmpeg failed. stderr: %s", error_msg)
-            raise TranscriptionError(f"ffmpeg failed to convert audio to PCM: {error_msg}") from exc
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
 
 class _SimpleTranscriptHandler(TranscriptResultStreamHandler):
     def __init__(self, transcript_result_stream):
@@ -165,4 +265,8 @@ def get_transcribe_service() -> TranscribeService:
     return _DEFAULT_SERVICE
 
 
-_DEFAULT_SERVICE = TranscribeService(region=settings.s3.region)
+_DEFAULT_SERVICE = TranscribeService(
+    region=settings.s3.region,
+    max_concurrent_streams=settings.transcribe.max_concurrent_streams,
+    stream_timeout_seconds=settings.transcribe.stream_timeout_seconds,
+)
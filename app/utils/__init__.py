@@ -6,12 +6,14 @@ from .security import (
     decode_access_token,
     generate_temporary_password,
     hash_password,
+    password_needs_rehash,
     verify_password,
 )
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "password_needs_rehash",
     "generate_temporary_password",
     "create_access_token",
     "decode_access_token",
@@ -5,18 +5,23 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
-import os
 import secrets
 import string
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from jose import JWTError, jwt
 from pydantic import BaseModel, ValidationError
 
 from app.config.settings import settings
 from app.models.user import User
 
+# Argon2id parameters; hashes written with other settings are upgraded on login.
+_ARGON2 = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+_ARGON2_PREFIX = "$argon2"
+# Legacy PBKDF2 parameters, kept so existing hashes still verify.
 _SALT_BYTES = 16
 _ITERATIONS = 120_000
 _TEMP_PASSWORD_MIN_LENGTH = 8
@@ -24,20 +29,13 @@ _TEMP_PASSWORD_CHARSET = string.ascii_letters + string.digits
 
 
 def hash_password(password: str) -> str:
-    """Return a salted PBKDF2 hash for the supplied password."""
+    """Return an Argon2id hash for the supplied password."""
 
-    salt = os.urandom(_SALT_BYTES)
-    derived = hashlib.pbkdf2_hmac(
-        "sha256",
-        password.encode("utf-8"),
-        salt,
-        _ITERATIONS,
-    )
-    return base64.b64encode(salt + derived).decode("utf-8")
+    return _ARGON2.hash(password)
 
 
-def verify_password(password: str, hashed: str) -> bool:
-    """Check whether the provided password matches the stored hash."""
+def _verify_legacy_password(password: str, hashed: str) -> bool:
+    """Check a password against a salted PBKDF2 hash from before Argon2id."""
 
     try:
         decoded = base64.b64decode(hashed.encode("utf-8"))
@@ -55,6 +53,28 @@ def verify_password(password: str, hashed: str) -> bool:
     return hmac.compare_digest(candidate, stored)
 
 
+def verify_password(password: str, hashed: str) -> bool:
+    """Check whether the provided password matches the stored hash."""
+
+    if not hashed.startswith(_ARGON2_PREFIX):
+        return _verify_legacy_password(password, hashed)
+    try:
+        return _ARGON2.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed: str) -> bool:
+    """Return whether the stored hash predates the current Argon2id parameters."""
+
+    if not hashed.startswith(_ARGON2_PREFIX):
+        return True
+    try:
+        return _ARGON2.check_needs_rehash(hashed)
+    except InvalidHashError:
+        return True
+
+
 def generate_temporary_password(length: int = 12) -> str:
     """Create a temporary password complying with basic complexity rules."""
 
@@ -131,6 +151,7 @@ def decode_access_token(token: str) -> TokenPayload:
 __all__ = [
     "hash_password",
     "verify_password",
+    "password_needs_rehash",
     "generate_temporary_password",
     "create_access_token",
     "decode_access_token",
@@ -7,7 +7,7 @@ from .auth import (
     TokenResponse,
 )
 from .common import ErrorResponse, SuccessResponse
-from .hello import HelloMessageCreate, HelloMessageRead
+from .hello import HelloMessageBulkCreate, HelloMessageCreate, HelloMessageRead
 from .groups import (
     GroupCreateRequest,
     GroupMemberResponse,
@@ -44,6 +44,7 @@ __all__ = [
     "ForgotPasswordRequest",
     "ForgotPasswordResponse",
     "HelloMessageCreate",
+    "HelloMessageBulkCreate",
     "HelloMessageRead",
     "TextToSpeechRequest",
     "SchoolCreateRequest",
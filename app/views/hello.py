@@ -2,13 +2,17 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HelloMessageCreate(BaseModel):
     message: str
 
 
+class HelloMessageBulkCreate(BaseModel):
+    messages: list[str] = Field(..., min_length=1, max_length=100)
+
+
 class HelloMessageRead(BaseModel):
     id: int
     message: str
@@ -21,6 +21,11 @@ from pydantic import (
 from app.models.user import AccountType, UserStatus
 from app.views.schools import SchoolResponse
 
+_UPPERCASE_PATTERN = re.compile(r"[A-Z]")
+_LOWERCASE_PATTERN = re.compile(r"[a-z]")
+_DIGIT_PATTERN = re.compile(r"\d")
+_NAME_PATTERN = re.compile(r"^[a-zA-Z\s\-']+$")
+
 
 def _validate_base64_payload(value: str) -> str:
     """Validate that the provided string is Base64-encoded (data URI accepted)."""
@@ -126,18 +131,18 @@ class UserRegistrationRequest(BaseModel):
     def validate_password(cls, value: str) -> str:
         if len(value) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", value):
+        if not _UPPERCASE_PATTERN.search(value):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", value):
+        if not _LOWERCASE_PATTERN.search(value):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", value):
+        if not _DIGIT_PATTERN.search(value):
             raise ValueError("Password must contain at least one digit")
         return value
 
     @field_validator("firstName", "lastName")
     @classmethod
     def validate_names(cls, value: str) -> str:
-        if not re.match(r"^[a-zA-Z\s\-']+$", value):
+        if not _NAME_PATTERN.match(value):
             raise ValueError(
                 "Name can only contain letters, spaces, hyphens, and apostrophes"
             )
@@ -276,11 +281,11 @@ class UserUpdateRequest(BaseModel):
             return value
         if len(value) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", value):
+        if not _UPPERCASE_PATTERN.search(value):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", value):
+        if not _LOWERCASE_PATTERN.search(value):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", value):
+        if not _DIGIT_PATTERN.search(value):
             raise ValueError("Password must contain at least one digit")
         return value
 
@@ -289,7 +294,7 @@ class UserUpdateRequest(BaseModel):
     def validate_optional_names(cls, value: Optional[str]) -> Optional[str]:
         if value is None:
             return value
-        if not re.match(r"^[a-zA-Z\s\-']+$", value):
+        if not _NAME_PATTERN.match(value):
             raise ValueError(
                 "Name can only contain letters, spaces, hyphens, and apostrophes"
             )
@@ -337,11 +342,11 @@ class UserChangePasswordRequest(BaseModel):
     def validate_new_password(cls, value: str) -> str:
         if len(value) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", value):
+        if not _UPPERCASE_PATTERN.search(value):
             raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", value):
+        if not _LOWERCASE_PATTERN.search(value):
             raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", value):
+        if not _DIGIT_PATTERN.search(value):
             raise ValueError("Password must contain at least one digit")
         return value
 